@@ -1,4 +1,4 @@
-from threading import RLock
+from threading import Lock
 from typing import ContextManager
 
 import wrapt
@@ -9,15 +9,21 @@ from telemetry.api.decorator import trace, extract_args
 from telemetry.api.metrics import Metrics
 from telemetry.api.trace import Tracer, SpanKind, Span, AttributeValue
 
-telemetry: Telemetry = wrapt.ObjectProxy(Telemetry())
-tracer: Tracer = wrapt.ObjectProxy(telemetry.tracer)
-metrics: Metrics = wrapt.ObjectProxy(telemetry.metrics)
+# the current instance, unwrapped.  Used by the package's own hot paths (spans, metrics, `@trace`) so that they don't
+# pay for proxy indirection on each call.  Always a fully-constructed instance, since rebinding it is a single store.
+_telemetry: Telemetry = Telemetry()
 
-_telemetry_lock = RLock()
+# stable proxies for callers that hold a reference (eg: `from telemetry import telemetry`), retargeted by `set_telemetry`
+telemetry: Telemetry = wrapt.ObjectProxy(_telemetry)
+tracer: Tracer = wrapt.ObjectProxy(_telemetry.tracer)
+metrics: Metrics = wrapt.ObjectProxy(_telemetry.metrics)
+
+# only taken by writers (`set_telemetry`)
+_telemetry_lock = Lock()
 
 
 def get_telemetry() -> Telemetry:
-    return telemetry.__wrapped__
+    return _telemetry
 
 
 def set_telemetry(instance: Telemetry):
@@ -27,15 +33,17 @@ def set_telemetry(instance: Telemetry):
     Replace current telemetry instance with a new instance.
 
     TODO: Add "test only" check to this method
-    TODO: use a read-write lock instead
 
     :param instance: new Telemetry instance
     :return: None
     """
+    global _telemetry
+
     with _telemetry_lock:
         telemetry.__wrapped__ = instance
         tracer.__wrapped__ = instance.tracer
         metrics.__wrapped__ = instance.metrics
+        _telemetry = instance
         instance.register()
 
 
@@ -46,7 +54,6 @@ def with_telemetry(telemetry: Telemetry) -> ContextManager[Telemetry]:
     Temporarily replace the Telementry instance with a new one within a context
 
     TODO: Add "test only" check to this method
-    TODO: use a read-write lock
     :param instance: new Telemetry instance
     :return: new Telemetry instance
     """
@@ -61,15 +68,27 @@ def with_telemetry(telemetry: Telemetry) -> ContextManager[Telemetry]:
     return wrapper()
 
 
+# shared by all handlers that `initialize_json_logger` installs the JSON format on
+_json_formatter = None
+
+
 def initialize_json_logger():
     """
     Registers the Json log formmater which with telemetry-aware logging that will include current attributes/labels in
     each log message.
+
+    Safe to call more than once: a single formatter instance is shared across all root handlers and handlers that
+    already use it are left alone.
     :return: None
     """
     import logging
     from telemetry.api.logger.json import JsonLogFormatter
 
+    global _json_formatter
+    if _json_formatter is None:
+        _json_formatter = JsonLogFormatter()
+
     root_logger = logging.getLogger()
     for handler in root_logger.handlers:
-        handler.setFormatter(JsonLogFormatter())
+        if handler.formatter is not _json_formatter:
+            handler.setFormatter(_json_formatter)
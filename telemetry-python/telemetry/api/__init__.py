@@ -1,39 +1,60 @@
-from typing import Mapping, Optional, Callable
+from typing import Mapping, Optional, Callable, Dict, Tuple, AbstractSet
 
 from opentelemetry.sdk.trace import Span
 
 class AttributeRegistry:
     def __init__(self):
-        self.attributes: Mapping[str, Attribute] = {}
-        self.label_keys = set()
+        # name -> (is_label, propagate, attribute) so that the hot-path flag checks are a single lookup
+        self._table: Dict[str, Tuple[bool, bool, 'Attribute']] = {}
+        # lazily-built set of the names to propagate (reset whenever a new attribute is registered)
+        self._propagated_keys: Optional[AbstractSet[str]] = None
+
+    @property
+    def attributes(self) -> Mapping[str, 'Attribute']:
+        return {name: entry[2] for name, entry in self._table.items()}
+
+    @property
+    def label_keys(self) -> AbstractSet[str]:
+        return frozenset(name for name, entry in self._table.items() if entry[0])
+
+    @property
+    def propagated_keys(self) -> AbstractSet[str]:
+        keys = self._propagated_keys
+        if keys is None:
+            keys = self._propagated_keys = frozenset(name for name, entry in self._table.items() if entry[1])
+        return keys
 
     def register(self, a: 'Attribute'):
-        if a.name in self.attributes:
+        if a.name in self._table:
             raise Exception(f"Attribute/label '{a.name}' already registered!")
-        self.attributes[a.name] = a
-        if a.is_label:
-            self.label_keys.add(a.name)
+        self._table[a.name] = (a.is_label, a.propagate, a)
+        self._propagated_keys = None
 
     def propagate(self, key: str) -> bool:
-        a = self.attributes.get(key)
-        if a:
-            return a.propagate
-        return False
+        entry = self._table.get(key)
+        return entry is not None and entry[1]
 
     def is_label(self, key: str) -> bool:
-        return key in self.label_keys
+        entry = self._table.get(key)
+        return entry is not None and entry[0]
 
     def __getitem__(self, item):
-        return self.attributes[item]
+        return self._table[item][2]
 
     def __iter__(self):
-        return self.attributes.values()
+        return iter([entry[2] for entry in self._table.values()])
 
 
 _REGISTRY = AttributeRegistry()
 
+# bound registry lookups for hot paths (an empty/None key is simply not found)
+propagate = _REGISTRY.propagate
+is_label = _REGISTRY.is_label
+
 
 class Attribute:
+    __slots__ = ('name', 'propagate', 'is_label')
+
     def __init__(self, name: str, propagate: bool = True, is_label: bool = False, register: bool = True):
         self.name = name
         self.propagate = propagate
@@ -46,6 +67,8 @@ class Attribute:
 
 
 class Label(Attribute):
+    __slots__ = ()
+
     def __init__(self, name: str, propagate: bool = True, register: bool = True):
         super().__init__(name, propagate, True, register)
 
@@ -57,15 +80,11 @@ class Attributes:
 
     @staticmethod
     def propagte(key: str) -> bool:
-        if not key:
-            return False
-        return Attributes.registry().propagate(key)
+        return propagate(key)
 
     @staticmethod
     def is_label(key: str) -> bool:
-        if not key:
-            return False
-        return Attributes.registry().is_label(key)
+        return is_label(key)
 
     _LABEL_KEYS = Attribute('_label_keys')
 
@@ -1,16 +1,32 @@
+import collections.abc
+import functools
 import inspect
 import logging
+import threading
 import typing
+import weakref
 from enum import Enum
 from typing import Dict, Optional
 
-import wrapt
-
+import telemetry
 from telemetry.api import Attribute, Label
 from telemetry.api.trace import AttributeValue
 
 ArgumentLabeler = typing.Callable[[any], Optional[str]]
-AttributeExtractor = typing.Callable[[Dict[str, any], typing.Callable[[any], any]], Dict[Attribute, any]]
+# an extractor may return either a mapping or an iterable of (attribute, value) pairs
+AttributeExtractor = typing.Callable[[Dict[str, any], typing.Callable[[any], any]],
+                                     typing.Union[typing.Mapping[Attribute, any], typing.Iterable[typing.Tuple[Attribute, any]]]]
+
+# ad-hoc (unregistered) attributes/labels created by `extract_args`, keyed by (type, name) so they're only created once
+_EXTRACT_ATTR_CACHE: Dict[typing.Tuple[type, str], Attribute] = {}
+
+
+def _extracted_attribute(attribute_type: typing.Type[Attribute], name: str) -> Attribute:
+    a = _EXTRACT_ATTR_CACHE.get((attribute_type, name))
+    if a is None:
+        a = _EXTRACT_ATTR_CACHE.setdefault((attribute_type, name), attribute_type(name, register=False))
+    return a
+
 
 def extract_args(*args: str, **kwargs) -> Optional[AttributeExtractor]:
     """
@@ -32,42 +48,42 @@ def extract_args(*args: str, **kwargs) -> Optional[AttributeExtractor]:
     :param kwargs: argument names to Attribute or Label to use for that argument
     :return: `AttributeExtractor` that will extract the given argument names as attributes/labels
     """
-    def extract(values: Dict[str, any], fn) -> Dict[Attribute, any]:
-        out = {}
-
-        for name in args:
-            if name not in values:
-                logging.warning(
-                    f"@trace decorator refers to an argument '{name}' that was not found in the "
-                    f"signature for {fn.__qualname__}! (this attribute will not be added)")
-            else:
-                out[Attribute(name, register=False)] = values[name]
-
-        for name, value in kwargs.items():
-            if name not in values:
-                logging.warning(
-                    f"@trace decorator refers to an argument '{name}' that was not found in the "
-                    f"signature for {fn.__qualname__}! (this attribute will not be added)")
-            else:
-                if isinstance(value, Attribute):
-                    out[value] = values[name]
-                elif isinstance(value, str):
-                    out[Attribute(value, register=False)] = values[name]
-                elif value == Label:
-                    out[Label(name, register=False)] = values[name]
-                elif value == Attribute:
-                    out[Attribute(name, register=False)] = values[name]
-                else:
-                    logging.warning(
-                        f"@trace decorator has invalid mapping for argument '{name}'.  Expected one of Label, Attribute or str but got {type(value)}")
-        return out
+    # resolve the argument name -> attribute/label mapping once, rather than on every call
+    mapping: typing.List[typing.Tuple[str, Attribute]] = [(name, _extracted_attribute(Attribute, name)) for name in args]
+
+    for name, value in kwargs.items():
+        if isinstance(value, Attribute):
+            mapping.append((name, value))
+        elif isinstance(value, str):
+            mapping.append((name, _extracted_attribute(Attribute, value)))
+        elif value == Label:
+            mapping.append((name, _extracted_attribute(Label, name)))
+        elif value == Attribute:
+            mapping.append((name, _extracted_attribute(Attribute, name)))
+        else:
+            logging.warning("@trace decorator has invalid mapping for argument '%s'.  Expected one of Label, Attribute or str but got %s",
+                            name, type(value))
+
+    plan = tuple(mapping)
+
+    def extract(values: Dict[str, any], fn) -> typing.List[typing.Tuple[Attribute, any]]:
+        # names missing from the signature are reported once when the decorator binds, not on each call
+        return [(a, values[name]) for name, a in plan if name in values]
+
+    # lets the decorator skip resolving arguments that this extractor will never read
+    extract.argument_names = frozenset(name for name, a in plan)
     return extract
 
 
 class TracedInvocation:
-    def __init__(self, owner, target):
+    # created for each traced call that extracts arguments
+    __slots__ = ('owner', 'target', 'has_receiver', 'arg_values')
+
+    def __init__(self, owner, target, has_receiver: bool = False):
         self.owner = owner
         self.target = target
+        # whether the first argument is the instance (or class) the method was called on, rather than an argument value
+        self.has_receiver = has_receiver
         self.arg_values = None
         
     def resolve_arguments(self, *args, **kwargs) -> Dict[str, any]:
@@ -75,75 +91,69 @@ class TracedInvocation:
         if not self.arg_values is None:
             return self.arg_values
 
-        import inspect
-
-        # initialize with explicitly-passed kwargs
-        arg_values = kwargs.copy()
-
-        # resolve the function signature (if not yet resolved)
-        if self.owner.signature is None:
-            self.owner.signature = inspect.signature(self.target)
-
-
-        def set_arg_value(name: str, value: any):
-            # if None value, then set to predefined value of 'none_value'
-            if value is None or value is inspect.Parameter.empty:
-                arg_values[name] = None
-                return
-
-            # if value is an enum, then extract the name
-            if isinstance(value, Enum):
-                value = value.name
-
-            arg_values[name] = value
-
-
-        for i, (name, param) in enumerate(self.owner.signature.parameters.items()):
-            if name == 'self' or name in arg_values:
-                continue
-
-            # we have positional argument
-            if i < len(args):
-                set_arg_value(name, args[i])
-            else:
-                if param.default:
-                    set_arg_value(name, param.default)
+        # the signature was already bound when the function was decorated (it always is when there is an extractor)
+        owner = self.owner
+
+        # positional arguments (enum values are converted to their names), then explicitly-passed kwargs, then the
+        # pre-resolved defaults of any parameters that weren't passed
+        nargs = len(args)
+        receiver = owner._receiver_name if self.has_receiver else None
+        arg_values = {name: args[i].name if isinstance(args[i], Enum) else args[i]
+                      for i, name in zip(owner._param_indices, owner._param_names)
+                      if i < nargs and name != receiver}
+        if kwargs:
+            arg_values.update(kwargs)
+        for name, value in owner._default_values:
+            if name not in arg_values and name != receiver:
+                arg_values[name] = value
 
         self.arg_values = arg_values
 
         return arg_values
 
 
-    def wrap_span_attributes(self, fn, decorator_name: str, setter: typing.Callable[[Attribute, any], None], extractor: Optional[AttributeExtractor]):
-        def wrapped(*args, **kwargs):
-            if extractor:
-                try:
-                    extracted = extractor(self.resolve_arguments(*args, **kwargs), self.target)
-                    if extracted:
-                        for attrib, value in extracted.items():
-                            setter(attrib, value)
-                except BaseException as ex:
-                    logging.warning(
-                        f"{decorator_name} decorator for {self.target.__qualname__} threw an exception during label extraction! {ex}")
+    def extract_span_attributes(self, decorator_name: str, setter: typing.Callable[[Attribute, any], None], extractor: AttributeExtractor, args, kwargs):
+        try:
+            extracted = extractor(self.resolve_arguments(*args, **kwargs), self.target)
+            if extracted:
+                if isinstance(extracted, collections.abc.Mapping):
+                    extracted = extracted.items()
+                for attrib, value in extracted:
+                    setter(attrib, value)
+        except BaseException as ex:
+            logging.warning("%s decorator for %s threw an exception during label extraction! %s",
+                            decorator_name, self.target.__qualname__, ex)
 
-            return fn(*args, **kwargs)
+def _defining_class_qualname(fn) -> Optional[str]:
+    """
+    Returns the qualified name of the class whose body the function is defined in, or None for plain (including
+    nested) functions.  This is based on `__qualname__` rather than parameter names, since a module-level function may
+    have a first parameter named `self`/`cls` and a method's first parameter may be named anything.
+    """
+    owner, _, _ = getattr(fn, '__qualname__', '').rpartition('.')
+    if not owner or owner.endswith('<locals>'):
+        return None
+    return owner
 
-        return wrapped
 
-@wrapt.decorator
-class trace(object):
+def _is_defined_on(fn, owner: type) -> bool:
+    """
+    Returns True if the function was defined in the body of `owner` (or one of its base classes), ie: the first
+    argument really is the instance (or class) the method was called on.  This rules out staticmethods called with an
+    unrelated first argument.
     """
-    Trace decorator that enables tracing of calls for the decorated method/function.
+    class_qualname = _defining_class_qualname(fn)
+    module = fn.__module__
+    return class_qualname is not None and \
+        any(cls.__qualname__ == class_qualname and cls.__module__ == module for cls in owner.__mro__)
 
-    category: override the trace category otherwise defaults to the qualified name of the decorated function/method
-    attributes: static set of attributes (of type `telemetry.Attribute`) to set on the span
-    attribute_extractor: a callable in the form:  (arguments, decorated_function) -> (attributes)
-    label_extractor: a callable in the form:  (arguments, decorated_function) -> (labels)
 
-    For `attribute_extractor` and `label_extractor` there is a helper function, `extract_args` that takes a list of argument names and
-    will return an `AttributeExtractor` that will extract the argument values as attributes/labels.
+class TraceDecorator(object):
+    """
+    Holds the configuration and per-function caches for a `@trace` decorated function/method.
     """
-    extract_args = extract_args
+    __slots__ = ('_param_names', '_param_indices', '_default_values', '_receiver_name', 'category',
+                 '_owner_cache', '_category_lock', 'attributes', '_static_attributes', 'extractor', '_needed_args')
 
     def __init__(self,
                  *,
@@ -152,38 +162,182 @@ class trace(object):
                  extractor: Optional[AttributeExtractor] = None
                  ):
 
-        self.signature = None
+        self._param_names: Optional[typing.Tuple[str, ...]] = None
+        self._param_indices: typing.Tuple[int, ...] = ()
+        self._default_values: typing.Tuple[typing.Tuple[str, any], ...] = ()
+        self._receiver_name: Optional[str] = None
         self.category = category
+        # weak, so that dynamically created classes can still be collected
+        self._owner_cache: typing.MutableMapping[type, typing.Tuple[bool, str]] = weakref.WeakKeyDictionary()
+        self._category_lock = threading.Lock()
         self.attributes = attributes or {}
+        # static attributes never change, so iterate a tuple of the items on each call instead of the dict
+        self._static_attributes = tuple(self.attributes.items())
         self.extractor = extractor
-
-    def _get_category(self, fn, instance):
-        import inspect
-        if hasattr(self, 'category') and self.category:
-            return self.category
-        elif instance:
-            if hasattr(instance, 'telemetry_category'):
-                return getattr(instance, 'telemetry_category')
-            else:
-                return f"{instance.__class__.__module__}.{instance.__class__.__name__}"
-        else:
-            return inspect.getmodule(fn).__name__
-
-    def __call__(self, fn, instance, args, kwargs):
-        from telemetry import telemetry
-
+        # argument names the extractor reads (if it declares them, eg: `extract_args`), otherwise all are resolved
+        self._needed_args: Optional[typing.AbstractSet[str]] = getattr(extractor, 'argument_names', None)
+
+    def _bind(self, fn, is_method: bool):
+        """
+        Resolves the signature of the decorated function (once) into parallel tuples of positional indexes and
+        parameter names (excluding any parameters the extractor doesn't need) plus a tuple of `(name, value)` defaults
+        for parameters that aren't passed, so that argument resolution doesn't need to introspect the function on each
+        call.  Annotations aren't used to skip the enum check, since they don't guarantee the runtime type (eg: a
+        `str`-based `Enum` value passed for a `str` parameter).
+
+        For methods, the first parameter (whatever it's named) is recorded as the receiver, which is left out of the
+        argument values when the call's first argument turns out to be the instance/class.  It's kept for staticmethods,
+        which can't be told apart from methods until they're called.
+        """
+        if self._param_names is None:
+            indices = []
+            names = []
+            defaults = []
+            parameters = inspect.signature(fn).parameters
+            if self._needed_args is not None and \
+                    not any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+                for name in sorted(self._needed_args.difference(parameters)):
+                    logging.warning("@trace decorator refers to an argument '%s' that was not found in the "
+                                    "signature for %s! (this attribute will not be added)", name, fn.__qualname__)
+
+            first = next(iter(parameters.values()), None)
+            if is_method and first is not None and \
+                    first.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD):
+                self._receiver_name = first.name
+
+            for i, (name, param) in enumerate(parameters.items()):
+                if self._needed_args is not None and name not in self._needed_args:
+                    continue
+
+                indices.append(i)
+                names.append(name)
+                # parameters without a default resolve to None, falsy defaults are left out
+                if param.default is inspect.Parameter.empty:
+                    defaults.append((name, None))
+                elif param.default:
+                    default = param.default
+                    defaults.append((name, default.name if isinstance(default, Enum) else default))
+
+            self._param_indices = tuple(indices)
+            self._default_values = tuple(defaults)
+            # published last, since it's what marks the signature as resolved
+            self._param_names = tuple(names)
+
+    def _owner_info(self, fn, instance) -> typing.Tuple[bool, str]:
+        """
+        Returns whether `instance` (the first argument) is the receiver of the decorated method, ie: the instance (or
+        the class itself, for classmethods) that it was called on, and the category to default to.  Both only depend on
+        the class, so they're resolved once per class and cached.
+        """
+        owner = instance if isinstance(instance, type) else type(instance)
+        info = self._owner_cache.get(owner)
+        if info is None:
+            with self._category_lock:
+                info = self._owner_cache.get(owner)
+                if info is None:
+                    if _is_defined_on(fn, owner):
+                        info = (True, f"{owner.__module__}.{owner.__name__}")
+                    else:
+                        info = (False, fn.__module__)
+                    self._owner_cache[owner] = info
+        return info
+
+    def _get_category(self, fn, instance) -> str:
+        # only called when the category isn't fixed by the decorator itself
+        if instance is None:
+            return fn.__module__
+
+        is_receiver, category = self._owner_info(fn, instance)
+        if is_receiver:
+            # read on each call, since `telemetry_category` may be set on the instance rather than the class
+            return getattr(instance, 'telemetry_category', None) or category
+        return category
+
+    def __call__(self, fn):
         if not callable(fn):
             raise Exception("Invalid use of @trace decorator. All arguments should be passed as keyword arguments, eg: @trace(category='foo')")
+
+        name = fn.__name__
+        is_method = _defining_class_qualname(fn) is not None
+
+        # arguments are only resolved when there is an extractor, so that's the only time the signature is needed
+        if self.extractor is not None:
+            self._bind(fn, is_method)
+
+        get_category = self._get_category
+        # the category is fixed unless it depends on the class the method is called on
+        fixed_category = self.category or (None if is_method else fn.__module__)
+        static_attributes = self._static_attributes
+        extractor = self.extractor
+
+        # the configuration is fixed at decoration time, so pick a wrapper that only does the work that's needed
+        if not static_attributes and extractor is None:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                # the unwrapped instance is looked up on each call (skipping the proxy) since it may be swapped by `set_telemetry`
+                tracer = telemetry._telemetry.tracer
+
+                category = fixed_category or get_category(fn, args[0] if args else None)
+                if not tracer.is_enabled(category):
+                    return fn(*args, **kwargs)
+
+                with tracer.span(category, name):
+                    return fn(*args, **kwargs)
+        elif extractor is None:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                tracer = telemetry._telemetry.tracer
+
+                category = fixed_category or get_category(fn, args[0] if args else None)
+                if not tracer.is_enabled(category):
+                    return fn(*args, **kwargs)
+
+                with tracer.span(category, name) as span:
+                    # set static attributes
+                    for a, value in static_attributes:
+                        span.set(a, value)
+                    return fn(*args, **kwargs)
         else:
-            if self.signature is None:
-                self.signature = inspect.signature(fn)
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                tracer = telemetry._telemetry.tracer
+
+                category = fixed_category or get_category(fn, args[0] if args else None)
+                if not tracer.is_enabled(category):
+                    return fn(*args, **kwargs)
+
+                with tracer.span(category, name) as span:
+                    # set static attributes
+                    for a, value in static_attributes:
+                        span.set(a, value)
+                    has_receiver = is_method and bool(args) and self._owner_info(fn, args[0])[0]
+                    TracedInvocation(self, fn, has_receiver).extract_span_attributes("@trace", span.set, extractor, args, kwargs)
+                    return fn(*args, **kwargs)
+
+        return wrapper
+
+
+def trace(fn: Optional[typing.Callable] = None,
+          *,
+          category: Optional[str] = None,
+          attributes: Optional[typing.Mapping[Attribute, AttributeValue]] = None,
+          extractor: Optional[AttributeExtractor] = None):
+    """
+    Trace decorator that enables tracing of calls for the decorated method/function.  May be used bare (`@trace`) or
+    with keyword arguments (`@trace(category='foo')`).
 
-            with telemetry.tracer.span(self._get_category(fn, instance), fn.__name__) as span:
-                # set static attributes
-                for a, value in self.attributes.items():
-                    span.set(a, value)
-                invocation = TracedInvocation(self, fn)
-                wrapped_extracted = invocation.wrap_span_attributes(fn, "@trace", span.set, self.extractor)
-                return wrapped_extracted(*args, **kwargs)
+    category: override the trace category otherwise defaults to the qualified name of the decorated function/method
+    attributes: static set of attributes (of type `telemetry.Attribute`) to set on the span
+    extractor: a callable in the form:  (arguments, decorated_function) -> (attributes), where the attributes are either
+               a mapping or an iterable of `(attribute, value)` pairs
+
+    For `extractor` there is a helper function, `extract_args` that takes a list of argument names and
+    will return an `AttributeExtractor` that will extract the argument values as attributes/labels.
+    """
+    decorator = TraceDecorator(category=category, attributes=attributes, extractor=extractor)
+    if fn is None:
+        return decorator
+    return decorator(fn)
 
 
+trace.extract_args = extract_args
@@ -8,11 +8,34 @@ from telemetry.api.helpers.environment import Environment
 class EnvironmentMetricsDecorator(MetricsExporter):
     def __init__(self, delegate: MetricsExporter):
         self.delegate = delegate
+        self._env_version = None
+        self._env_labels = None
+        self._env_items = ()
+        self._env_keys = frozenset()
+
+    def _refresh(self):
+        # only re-snapshot when the environment labels were changed in place (which bumps the version) or replaced
+        version = Environment.version
+        env_labels = Environment.labels
+        if version != self._env_version or env_labels is not self._env_labels:
+            self._env_items = tuple(env_labels.items())
+            self._env_keys = frozenset(env_labels)
+            self._env_labels = env_labels
+            self._env_version = version
 
     def export(self, export_records: Sequence[ExportRecord]) -> "MetricsExportResult":
-        for metric in export_records:
-            labels = dict(metric.labels)
-            labels.update(Environment.labels)
-            metric.labels = tuple(labels.items())
+        self._refresh()
+
+        env_items = self._env_items
+        if env_items:
+            env_keys = self._env_keys
+            for metric in export_records:
+                if env_keys.isdisjoint(key for key, _ in metric.labels):
+                    metric.labels = tuple(metric.labels) + env_items
+                else:
+                    # environment labels win over any locally-specified labels
+                    labels = dict(metric.labels)
+                    labels.update(env_items)
+                    metric.labels = tuple(labels.items())
 
         return self.delegate.export(export_records)
@@ -1,3 +1,4 @@
+import collections
 import threading
 
 import telemetry
@@ -16,7 +17,8 @@ class InMemorySpanExporter(SpanExporter):
     """
 
     def __init__(self):
-        self._finished_spans = []
+        # deque.extend is atomic, so exporting doesn't need the lock
+        self._finished_spans = collections.deque()
         self._stopped = False
         self._lock = threading.Lock()
 
@@ -28,14 +30,13 @@ class InMemorySpanExporter(SpanExporter):
     def get_finished_spans(self) -> typing.List[telemetry.Span]:
         """Get list of collected spans."""
         with self._lock:
-            return list(map(lambda s: telemetry.Span(s), self._finished_spans))
+            return [telemetry.Span(s) for s in tuple(self._finished_spans)]
 
     def export(self, spans: typing.Sequence[Span]) -> SpanExportResult:
         """Stores a list of spans in memory."""
         if self._stopped:
             return SpanExportResult.FAILURE
-        with self._lock:
-            self._finished_spans.extend(spans)
+        self._finished_spans.extend(spans)
         return SpanExportResult.SUCCESS
 
     def shutdown(self):
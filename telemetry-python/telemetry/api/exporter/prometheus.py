@@ -63,11 +63,12 @@ API
 ---
 """
 
+import functools
 import logging
 import os
 import re
 import threading
-from typing import Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from opentelemetry.sdk.metrics import Counter, ValueRecorder, Observer
 from opentelemetry.sdk.metrics.export import (
@@ -87,6 +88,105 @@ from prometheus_client.core import (
 
 logger = logging.getLogger(__name__)
 
+# maps every ASCII character other than [A-Za-z0-9_] to '_'
+_SANITIZE_TABLE = {i: '_' for i in range(128) if not (chr(i).isalnum() or chr(i) == '_')}
+_NON_LETTERS_NOR_DIGITS_RE = re.compile(r"[^\w]", re.UNICODE | re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _sanitize(key: str) -> str:
+    """sanitize the given metric name or label according to Prometheus rule.
+    Replace all characters other than [A-Za-z0-9_] with '_'.
+
+    Label keys and metric names come from a small, mostly fixed set, so results are cached.
+    """
+    if key.isascii():
+        return key.translate(_SANITIZE_TABLE)
+    return _NON_LETTERS_NOR_DIGITS_RE.sub("_", key)
+
+
+@functools.lru_cache(maxsize=4096)
+def _metric_name(prefix: str, name: str) -> str:
+    if prefix != "":
+        return prefix + "_" + _sanitize(name)
+    return _sanitize(name)
+
+
+def _translate_counter(export_record: ExportRecord, metric_name: str, description: str, label_keys, label_values):
+    prometheus_metric = CounterMetricFamily(
+        name=metric_name, documentation=description, labels=label_keys
+    )
+    prometheus_metric.add_metric(
+        labels=label_values, value=export_record.aggregator.checkpoint
+    )
+    return prometheus_metric
+
+
+def _translate_observer(export_record: ExportRecord, metric_name: str, description: str, label_keys, label_values):
+    prometheus_metric = GaugeMetricFamily(
+        name=metric_name, documentation=description, labels=label_keys
+    )
+    prometheus_metric.add_metric(
+        labels=label_values, value=export_record.aggregator.checkpoint.last
+    )
+    return prometheus_metric
+
+
+def _translate_summary(export_record: ExportRecord, metric_name: str, description: str, label_keys, label_values):
+    value = export_record.aggregator.checkpoint
+    prometheus_metric = SummaryMetricFamily(
+        name=metric_name,
+        documentation=description,
+        labels=label_keys,
+    )
+    prometheus_metric.add_metric(
+        labels=label_values,
+        count_value=value.count,
+        sum_value=value.sum,
+    )
+    return prometheus_metric
+
+
+def _translate_unknown(export_record: ExportRecord, metric_name: str, description: str, label_keys, label_values):
+    prometheus_metric = UnknownMetricFamily(
+        name=metric_name,
+        documentation=description,
+        labels=label_keys,
+    )
+    prometheus_metric.add_metric(labels=label_values, value=export_record.aggregator.checkpoint)
+    return prometheus_metric
+
+
+_Translator = Callable[[ExportRecord, str, str, List[str], List[Any]], Any]
+
+# (instrument type, aggregator type) -> translator (or None if unsupported), so the isinstance checks against the
+# instrument classes are only done the first time a combination is seen
+_TRANSLATORS: Dict[Tuple[type, type], Optional[_Translator]] = {}
+
+
+def _translator(instrument_type: type, aggregator_type: type) -> Optional[_Translator]:
+    key = (instrument_type, aggregator_type)
+    try:
+        return _TRANSLATORS[key]
+    except KeyError:
+        pass
+
+    if issubclass(instrument_type, Counter):
+        translate = _translate_counter
+    elif issubclass(instrument_type, Observer):
+        translate = _translate_observer
+    # TODO: Add support for histograms when supported in OT
+    elif issubclass(instrument_type, ValueRecorder):
+        if issubclass(aggregator_type, MinMaxSumCountAggregator):
+            translate = _translate_summary
+        else:
+            translate = _translate_unknown
+    else:
+        translate = None
+
+    _TRANSLATORS[key] = translate
+    return translate
+
 
 class PrometheusMetricsExporter(MetricsExporter):
     """Prometheus metric exporter for OpenTelemetry.
@@ -120,7 +220,7 @@ class PrometheusMetricsExporter(MetricsExporter):
     def _get_collector(self, instrumentor: InstrumentationInfo) -> 'CustomCollector':
         col = self.collectors.get(instrumentor)
         if not col:
-            #logger.debug(f"Registering collector for: {instrumentor}")
+            logger.debug("Registering collector for: %s", instrumentor)
             col = CustomCollector(instrumentor, self.prefix)
             REGISTRY.register(col)
             self.collectors[instrumentor] = col
@@ -128,17 +228,25 @@ class PrometheusMetricsExporter(MetricsExporter):
         return col
 
     def export(self, export_records: Sequence[ExportRecord]) -> MetricsExportResult:
-        collector: Optional[CustomCollector] = None
+        # group the records by instrumentor (single pass) so that each collector only receives its own records, once
+        grouped: Dict[InstrumentationInfo, List[ExportRecord]] = {}
         for rec in export_records:
-            if collector is None or collector.instrumentation_info != rec.instrument.meter.instrumentation_info:
-                #logging.debug(f"Fetching collector for {rec.instrument.meter.instrumentation_info}")
-                collector = self._get_collector(rec.instrument.meter.instrumentation_info)
-            collector.add_metrics_data(export_records)
+            info = rec.instrument.meter.instrumentation_info
+            records = grouped.get(info)
+            if records is None:
+                records = grouped[info] = []
+            records.append(rec)
+
+        for info, records in grouped.items():
+            self._get_collector(info).add_metrics_data(records)
 
         return MetricsExportResult.SUCCESS
 
     def shutdown(self) -> None:
         REGISTRY.unregister(self._collector)
+        for collector in self.collectors.values():
+            REGISTRY.unregister(collector)
+        self.collectors.clear()
 
 
 class CustomCollector:
@@ -151,9 +259,7 @@ class CustomCollector:
         self._prefix = prefix
         self._lock = threading.RLock()
         self._metrics_to_export = []
-        self._non_letters_nor_digits_re = re.compile(
-            r"[^\w]", re.UNICODE | re.IGNORECASE
-        )
+        self._label_keys_cache: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
 
     def add_metrics_data(self, export_records: Sequence[ExportRecord]) -> None:
         with self._lock:
@@ -174,63 +280,28 @@ class CustomCollector:
                     yield prometheus_metric
 
     def _translate_to_prometheus(self, export_record: ExportRecord):
-        prometheus_metric = None
-        label_values = []
-        label_keys = []
-        for label_tuple in export_record.labels:
-            label_keys.append(self._sanitize(label_tuple[0]))
-            label_values.append(label_tuple[1])
-
-        metric_name = ""
-        if self._prefix != "":
-            metric_name = self._prefix + "_"
-        metric_name += self._sanitize(export_record.instrument.name)
-
-        description = getattr(export_record.instrument, "description", "")
-        if isinstance(export_record.instrument, Counter):
-            prometheus_metric = CounterMetricFamily(
-                name=metric_name, documentation=description, labels=label_keys
-            )
-            prometheus_metric.add_metric(
-                labels=label_values, value=export_record.aggregator.checkpoint
-            )
-        elif isinstance(export_record.instrument, Observer):
-            prometheus_metric = GaugeMetricFamily(
-                name=metric_name, documentation=description, labels=label_keys
-            )
-            prometheus_metric.add_metric(
-                labels=label_values, value=export_record.aggregator.checkpoint.last
-            )
-        # TODO: Add support for histograms when supported in OT
-        elif isinstance(export_record.instrument, ValueRecorder):
-            value = export_record.aggregator.checkpoint
-            if isinstance(export_record.aggregator, MinMaxSumCountAggregator):
-                prometheus_metric = SummaryMetricFamily(
-                    name=metric_name,
-                    documentation=description,
-                    labels=label_keys,
-                )
-                prometheus_metric.add_metric(
-                    labels=label_values,
-                    count_value=value.count,
-                    sum_value=value.sum,
-                )
-            else:
-                prometheus_metric = UnknownMetricFamily(
-                    name=metric_name,
-                    documentation=description,
-                    labels=label_keys,
-                )
-                prometheus_metric.add_metric(labels=label_values, value=value)
-
-        else:
+        labels = export_record.labels
+        raw_keys = tuple(key for key, _ in labels)
+        # the label keys of an instrument rarely change, so the sanitized keys are shared between records
+        label_keys = self._label_keys_cache.get(raw_keys)
+        if label_keys is None:
+            label_keys = self._label_keys_cache[raw_keys] = tuple(_sanitize(key) for key in raw_keys)
+        label_values = [value for _, value in labels]
+
+        metric_name = _metric_name(self._prefix, export_record.instrument.name)
+
+        translate = _translator(type(export_record.instrument), type(export_record.aggregator))
+        if translate is None:
             logger.warning(
                 "Unsupported metric type. %s", type(export_record.instrument)
             )
-        return prometheus_metric
+            return None
+
+        description = getattr(export_record.instrument, "description", "")
+        return translate(export_record, metric_name, description, label_keys, label_values)
 
     def _sanitize(self, key: str) -> str:
         """sanitize the given metric name or label according to Prometheus rule.
         Replace all characters other than [A-Za-z0-9_] with '_'.
         """
-        return self._non_letters_nor_digits_re.sub("_", key)
+        return _sanitize(key)
@@ -1,5 +1,47 @@
+import itertools
 import os
 
+# `next()` on a shared counter is atomic, so concurrent changes never reuse a version
+_versions = itertools.count(1)
+
+
+class _EnvironmentDict(dict):
+    """
+    A dict that bumps `Environment.version` whenever it's changed in place, so that consumers that snapshot the
+    environment labels/attributes can tell when to refresh.
+    """
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        Environment.version = next(_versions)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        Environment.version = next(_versions)
+
+    def clear(self):
+        super().clear()
+        Environment.version = next(_versions)
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        Environment.version = next(_versions)
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        Environment.version = next(_versions)
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        Environment.version = next(_versions)
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        Environment.version = next(_versions)
+
 
 class Environment:
     label_prefix = "METRICS_LABEL_"
@@ -9,27 +51,60 @@ class Environment:
         'METRICS_APP_VERSION': 'app.version',
     }
 
-    labels = {}
-    attributes = {}
+    labels = _EnvironmentDict()
+    attributes = _EnvironmentDict()
+
+    # bumped whenever `labels`/`attributes` are re-parsed or changed in place.  Consumers that snapshot them should
+    # compare this (along with the dicts' identity, in case they're replaced) rather than re-reading them on each use.
+    version = 0
+
+    # the relevant environment variables the current `labels`/`attributes` were parsed from, and copies of what they
+    # were parsed into (so that changes made to `labels`/`attributes` outside this class invalidate the snapshot)
+    _environ = None
+    _parsed_labels = None
+    _parsed_attributes = None
 
     @classmethod
     def initialize(cls):
-        def parse(prefix):
-            out = {}
-            for key, value in os.environ.items():
-                if key in cls.label_variables:
-                    out[cls.label_variables[key]] = value
-                elif key.startswith(prefix):
-                    out[key[len(prefix):].lower()] = value
-            return out
-
-        cls.labels = parse(cls.label_prefix)
-        cls.attributes = parse(cls.attrib_prefix)
+        label_prefix = cls.label_prefix
+        attrib_prefix = cls.attrib_prefix
+        label_variables = cls.label_variables
+
+        # single pass over the environment, only keeping the variables that contribute labels or attributes
+        environ = tuple((key, value) for key, value in os.environ.items()
+                        if key in label_variables or key.startswith(label_prefix) or key.startswith(attrib_prefix))
+
+        # nothing to do if the relevant variables are unchanged and the parsed values haven't been changed since (this
+        # also keeps the dicts' identity stable)
+        if environ == cls._environ and cls.labels == cls._parsed_labels and cls.attributes == cls._parsed_attributes:
+            return
+
+        labels = {}
+        attributes = {}
+        for key, value in environ:
+            if key in label_variables:
+                labels[label_variables[key]] = value
+                attributes[label_variables[key]] = value
+            elif key.startswith(label_prefix):
+                labels[key[len(label_prefix):].lower()] = value
+            elif key.startswith(attrib_prefix):
+                attributes[key[len(attrib_prefix):].lower()] = value
+
+        cls.labels = _EnvironmentDict(labels)
+        cls.attributes = _EnvironmentDict(attributes)
+        cls.version = next(_versions)
+        cls._environ = environ
+        cls._parsed_labels = dict(labels)
+        cls._parsed_attributes = dict(attributes)
 
     @classmethod
     def _clear(cls):
         """
         Should only be called from tests!
         """
-        cls.labels = {}
-        cls.attributes = {}
+        cls.labels = _EnvironmentDict()
+        cls.attributes = _EnvironmentDict()
+        cls.version = next(_versions)
+        cls._environ = None
+        cls._parsed_labels = None
+        cls._parsed_attributes = None
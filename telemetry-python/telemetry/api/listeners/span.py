@@ -1,20 +1,22 @@
+import sys
 from typing import Optional
 
 from opentelemetry import context as context_api
 from opentelemetry.sdk.trace import SpanProcessor, Span
 
+from telemetry.api import Attributes
+
 
 class InstrumentorSpanListener(SpanProcessor):
     """
     A span listener that wraps a SpanProcessor and enables it for the given instrumentors onlys
     """
     def __init__(self, delegate: SpanProcessor, *instrumentors: str):
-        self.instrumentors = set(instrumentors)
-
-        # for each instrumentor, add an alias of 'opentelemetry.instrumentation.{name}' so that we match 3rd-party instrumentors without the prefix
-        for i in instrumentors:
-            if not i.startswith('opentelemetry.instrumentation.'):
-                self.instrumentors.add(f'opentelemetry.instrumentation.{i}')
+        # for each instrumentor, add an alias of 'opentelemetry.instrumentation.{name}' so that we match 3rd-party
+        # instrumentors without the prefix.  Names are interned since they're compared against on every span.
+        self.instrumentors = frozenset(sys.intern(i) for i in instrumentors) | \
+            frozenset(sys.intern(f'opentelemetry.instrumentation.{i}') for i in instrumentors
+                      if not i.startswith('opentelemetry.instrumentation.'))
 
         self.delegate = delegate
 
@@ -22,10 +24,18 @@ class InstrumentorSpanListener(SpanProcessor):
         return span.instrumentation_info.name in self.instrumentors
 
     def on_start(self, span: Span, parent_context: Optional[context_api.Context] = None):
-        self.delegate.on_start(span)
+        if span.instrumentation_info.name in self.instrumentors:
+            self.delegate.on_start(span, parent_context)
 
     def on_end(self, span: Span):
-        self.delegate.on_end(span)
+        if span.instrumentation_info.name in self.instrumentors:
+            self.delegate.on_end(span)
+
+    def shutdown(self):
+        self.delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.delegate.force_flush(timeout_millis)
 
 
 class LabelAttributes(SpanProcessor):
@@ -34,13 +44,18 @@ class LabelAttributes(SpanProcessor):
     """
     def __init__(self, *attributes: str):
         self.attributes = attributes
+        self._attribute_set = frozenset(attributes)
 
     def on_start(self, span: "trace_sdk.Span", parent_context: Optional[context_api.Context] = None) -> None:
-        from telemetry import Attributes
+        existing = span.attributes.get(Attributes._LABEL_KEYS.name)
+        # nothing to do (and no need to replace the attribute) if the attributes are already marked as labels
+        if existing is not None and self._attribute_set.issubset(existing):
+            return
+
+        span.set_attribute(Attributes._LABEL_KEYS.name, list(self._attribute_set.union(existing or ())))
 
-        label_keys = set(span.attributes.get(Attributes._LABEL_KEYS.name, ()))
-        label_keys.update(self.attributes)
-        span.set_attribute(Attributes._LABEL_KEYS.name, list(label_keys))
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
 
 
 
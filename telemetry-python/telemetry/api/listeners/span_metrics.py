@@ -10,11 +10,34 @@ import telemetry
 from telemetry.api import Attributes
 from telemetry.api.helpers.environment import Environment
 
+_registry = Attributes.registry()
+_STATUS_KEY = Attributes.TRACE_STATUS.name
+
 
 class SpanMetricsProcessor(SpanProcessor):
 
     def __init__(self, metrics):
         self.metrics = metrics
+        # resolved on the first span end (metrics are never replaced once created)
+        self._duration_metric = None
+        self._env_version = None
+        self._env_attributes = None
+        self._env_attribute_items = ()
+        self._env_labels = None
+        self._env_label_items = ()
+
+    def _refresh_environment(self):
+        # only re-snapshot when the environment labels/attributes were changed in place (which bumps the version) or
+        # replaced.  The version is read first, so a change made after it's read is picked up on the next span.
+        version = Environment.version
+        attributes = Environment.attributes
+        labels = Environment.labels
+        if version != self._env_version or attributes is not self._env_attributes or labels is not self._env_labels:
+            self._env_attribute_items = tuple(attributes.items())
+            self._env_label_items = tuple(labels.items())
+            self._env_attributes = attributes
+            self._env_labels = labels
+            self._env_version = version
 
     def on_start(self, span: "Span", parent_context: Optional[context_api.Context] = None) -> None:
         """
@@ -25,15 +48,16 @@ class SpanMetricsProcessor(SpanProcessor):
         :param parent_context:
         :return:
         """
-        current_span = trace_api.get_current_span(context_api.get_current())
+        # the span's parent is taken from `parent_context`, or the current context if that's None
+        current_span = trace_api.get_current_span(parent_context)
 
         wrapped_span = telemetry.Span(span)
 
         if current_span and not isinstance(current_span, trace_api.DefaultSpan):
-            # copy parent span's attributes into this span
-            for key, value in current_span.attributes.items():
-                if Attributes.propagte(key):
-                    span.set_attribute(key, value)
+            # copy parent span's propagated attributes into this span
+            parent_attributes = current_span.attributes
+            for key in _registry.propagated_keys.intersection(parent_attributes):
+                span.set_attribute(key, parent_attributes[key])
 
         # set/overwrite any span-specific attributes/labels
         wrapped_span.set(Attributes.TRACE_ID, str(span.context.trace_id))
@@ -42,27 +66,31 @@ class SpanMetricsProcessor(SpanProcessor):
         wrapped_span.set(Attributes.TRACE_CATEGORY, wrapped_span.category)
         wrapped_span.set(Attributes.TRACE_NAME, wrapped_span.qname)
 
-        for key, value in Environment.attributes.items():
-            wrapped_span.set_attribute(key, value)
+        self._refresh_environment()
+
+        if self._env_attribute_items:
+            set_attribute = wrapped_span.set_attribute
+            for key, value in self._env_attribute_items:
+                set_attribute(key, value)
 
-        for key, value in Environment.labels.items():
-            wrapped_span.set_label(key, value)
+        if self._env_label_items:
+            set_label = wrapped_span.set_label
+            for key, value in self._env_label_items:
+                set_label(key, value)
 
         super().on_start(span, parent_context)
 
     def on_end(self, span: "Span") -> None:
-        elapsed_ms = int((span.end_time - span.start_time) / 1000000)
+        elapsed_ms = (span.end_time - span.start_time) // 1000000
 
-        metric = self.metrics._get_metric("trace", f"duration", int, ValueRecorder, unit="ms")
+        metric = self._duration_metric
+        if metric is None:
+            metric = self._duration_metric = self.metrics._get_metric("trace", "duration", int, ValueRecorder, unit="ms")
         wrapped_span = telemetry.Span(span)
 
         labels = wrapped_span.labels
 
-        status = "OK"
-        if not span.status.is_ok:
-            status = "ERROR"
-
-        labels[Attributes.TRACE_STATUS.name] = status
+        labels[_STATUS_KEY] = "OK" if span.status.is_ok else "ERROR"
 
         metric.record(elapsed_ms, labels=labels)
 
@@ -70,5 +98,7 @@ class SpanMetricsProcessor(SpanProcessor):
         super().shutdown()
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
-        return super().force_flush(timeout_millis)
+        # nothing is buffered here.  Returning True matters since `SynchronousMultiSpanProcessor` stops flushing the
+        # remaining processors (eg: batched exporters) on the first falsy result.
+        return True
 
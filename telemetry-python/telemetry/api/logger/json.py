@@ -2,21 +2,32 @@ from datetime import datetime
 
 from pythonjsonlogger import jsonlogger
 
+import telemetry
+
 
 class JsonLogFormatter(jsonlogger.JsonFormatter):
     copy_fields = ['filename', 'lineno', 'module', 'process', 'processName', 'threadName']
 
-    def add_fields(self, log_record, record, message_dict):
-        from telemetry import tracer
+    # (second, formatted second) of the last timestamp, stored as a single tuple so that it's updated atomically
+    _timestamp_second = (None, '')
 
+    def _timestamp(self, created: float) -> str:
+        # records are mostly created within the same second, so only the sub-second part is formatted per record
+        second = int(created)
+        cached_second, prefix = self._timestamp_second
+        if second != cached_second:
+            prefix = datetime.fromtimestamp(second).strftime('%Y-%m-%dT%H:%M:%S')
+            self._timestamp_second = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1000000):06d}"
+
+    def add_fields(self, log_record, record, message_dict):
         super(JsonLogFormatter, self).add_fields(log_record, record, message_dict)
-        log_record['@timestamp'] = datetime.now().isoformat()
+        log_record['@timestamp'] = self._timestamp(record.created)
         log_record['level'] = record.levelname
         log_record['logger'] = record.name
-        log_record['attributes'] = tracer.attributes
+        log_record['attributes'] = telemetry._telemetry.tracer.attributes
 
         for name in self.copy_fields:
-            if hasattr(record, name):
-                value = getattr(record, name)
-                if value is not None:
-                    log_record[name] = str(value)
+            value = getattr(record, name, None)
+            if value is not None:
+                log_record[name] = str(value)
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, Dict, Type, TypeVar, Callable, Union
+from typing import Optional, Dict, Tuple, Type, TypeVar, Callable, Union
 
 import opentelemetry.sdk.metrics as metrics_sdk
 from opentelemetry.metrics import Metric, ValueT
@@ -10,6 +10,19 @@ from telemetry.api.otel.meter_provider import ManagedMeterProvider
 
 T = TypeVar("T")
 
+# metric/observer type -> name of the `Meter` method that creates it
+_METRIC_FACTORIES: Dict[type, str] = {
+    metrics_sdk.Counter: 'create_counter',
+    metrics_sdk.ValueRecorder: 'create_valuerecorder',
+    metrics_sdk.UpDownCounter: 'create_updowncounter',
+}
+
+_OBSERVER_FACTORIES: Dict[type, str] = {
+    metrics_sdk.ValueObserver: 'register_valueobserver',
+    metrics_sdk.UpDownSumObserver: 'register_updownsumobserver',
+    metrics_sdk.SumObserver: 'register_sumobserver',
+}
+
 
 def _convert_labels(labels: Dict[Union[Label, str], str]):
     if labels is None:
@@ -23,6 +36,8 @@ def _convert_labels(labels: Dict[Union[Label, str], str]):
     return converted
 
 class Observer:
+    __slots__ = ('_delegate',)
+
     def __init__(self, delegate: metrics_sdk.Observer):
         self._delegate = delegate
 
@@ -37,8 +52,9 @@ class Metrics:
 
         self.meter_provider = ManagedMeterProvider(stateful=stateful)
         self._telemetry: Telemetry = telemetry
-        self._metrics: Dict[str, Metric] = {}
-        self._observers: Dict[str, Observer] = {}
+        # keyed by (category, name) so that lookups don't need to format the fully-qualified name
+        self._metrics: Dict[Tuple[str, str], Metric] = {}
+        self._observers: Dict[Tuple[str, str], Observer] = {}
         self._meter = self.meter_provider.get_meter(name)
         self.name = name
 
@@ -59,71 +75,70 @@ class Metrics:
                            unit: str = "1",
                            description: Optional[str] = None):
 
-        fqn = f"{category}.{name}"
+        key = (category, name)
 
-        if fqn in self._observers:
+        if key in self._observers:
             return
         else:
-            if observer_type == metrics_sdk.ValueObserver:
-                observer = self._meter.register_valueobserver(callback, fqn, description or '', unit, value_type)
-            elif observer_type == metrics_sdk.UpDownSumObserver:
-                observer = self._meter.register_updownsumobserver(callback, fqn, description or '', unit, value_type)
-            elif observer_type == metrics_sdk.SumObserver:
-                observer = self._meter.register_sumobserver(callback, fqn, description or '', unit, value_type)
-            else:
+            fqn = f"{category}.{name}"
+            factory = _OBSERVER_FACTORIES.get(observer_type)
+            if factory is None:
                 raise Exception(f"Observer type not implemented: {observer_type}")
+            observer = getattr(self._meter, factory)(callback, fqn, description or '', unit, value_type)
 
-            self._observers[fqn] = observer
+            self._observers[key] = observer
 
     def _get_metric(self, category: str, name: str, value_type: Type[ValueT], metric_type: Type[T], unit: str = "1",
                     description: Optional[str] = None) -> T:
 
-        fqn = f"{category}.{name}"
+        key = (category, name)
 
-        if fqn in self._metrics:
-            return self._metrics[fqn]
+        metric = self._metrics.get(key)
+        if metric is not None:
+            return metric
         else:
-            if metric_type == metrics_sdk.Counter:
-                metric = self._meter.create_counter(fqn, description or '', unit=unit, value_type=value_type)
-            elif metric_type == metrics_sdk.ValueRecorder:
-                metric = self._meter.create_valuerecorder(fqn, description or '', unit=unit, value_type=value_type)
-            elif metric_type == metrics_sdk.UpDownCounter:
-                metric = self._meter.create_updowncounter(fqn, description or '', unit=unit, value_type=value_type)
-            else:
+            fqn = f"{category}.{name}"
+            factory = _METRIC_FACTORIES.get(metric_type)
+            if factory is None:
                 raise Exception(f"Unknown metric type: {metric_type}")
+            metric = getattr(self._meter, factory)(fqn, description or '', unit=unit, value_type=value_type)
 
-            self._metrics[fqn] = metric
+            self._metrics[key] = metric
 
             return metric
 
-    def _merge_labels(self, labels: Dict[str, str]):
-        all_labels = self._telemetry.tracer.labels.copy()
-        all_labels.update(labels)
+    def _merge_labels(self, labels: Optional[Dict[Union[Label, str], str]]):
+        # `tracer.labels` is built on each call, so the given labels are converted straight into it rather than into
+        # an intermediate dict that's then copied again
+        all_labels = self._telemetry.tracer.labels
+        if labels:
+            for label, value in labels.items():
+                all_labels[label.name if isinstance(label, Label) else label] = value
         return all_labels
 
     def add_exporter(self, exporter: metrics_sdk.MetricsExporter, interval: int):
         wrapped = EnvironmentMetricsDecorator(exporter)
         self.meter_provider.add_exporter(wrapped, interval)
 
-    def counter(self, category: str, name: str, value: Union[int, float] = 1, labels: Dict[Union[Label, str], str] = {},
+    def counter(self, category: str, name: str, value: Union[int, float] = 1, labels: Optional[Dict[Union[Label, str], str]] = None,
                 unit: str = "1",
                 description: Optional[str] = None):
         self._get_metric(category, name, type(value), metrics_sdk.Counter, unit, description)\
-            .add(value, self._merge_labels(_convert_labels(labels)))
+            .add(value, self._merge_labels(labels))
 
-    def up_down_counter(self, category: str, name: str, value: Union[int, float] = 1, labels: Dict[Union[Label, str], str] = {},
+    def up_down_counter(self, category: str, name: str, value: Union[int, float] = 1, labels: Optional[Dict[Union[Label, str], str]] = None,
                 unit: str = "1",
                 description: Optional[str] = None):
         self._get_metric(category, name, type(value), metrics_sdk.UpDownCounter, unit, description) \
-            .add(value, self._merge_labels(_convert_labels(labels)))
+            .add(value, self._merge_labels(labels))
 
 
-    def record_value(self, category: str, name: str, value: Union[int, float],
-                     labels: Dict[Union[Label, str], str] = {},
+    def record_value(self, category: str, name: str, value: Union[int, float] = 1,
+                     labels: Optional[Dict[Union[Label, str], str]] = None,
                      unit: str = "1",
                      description: Optional[str] = None):
         self._get_metric(category, name, type(value), metrics_sdk.ValueRecorder, unit, description)\
-            .record(value, self._merge_labels(_convert_labels(labels)))
+            .record(value, self._merge_labels(labels))
 
     def gauge(self,
               category: str,
@@ -132,8 +147,14 @@ class Metrics:
               unit: str = '1',
               description: Optional[str] = None):
 
+        wrapper: Optional[Observer] = None
+
         def observer_callback(o: metrics_sdk.Observer):
-            callback(Observer(o))
+            # the SDK passes the same observer on each collection, so its wrapper is reused
+            nonlocal wrapper
+            if wrapper is None or wrapper._delegate is not o:
+                wrapper = Observer(o)
+            callback(wrapper)
 
         self._register_observer(category, name, observer_callback, float, metrics_sdk.ValueObserver, unit, description)
 
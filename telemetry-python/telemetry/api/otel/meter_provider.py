@@ -1,3 +1,4 @@
+import threading
 from typing import Dict
 
 from opentelemetry.metrics import Meter
@@ -10,27 +11,31 @@ class ManagedMeterProvider(MeterProvider):
         super().__init__(stateful, resource, shutdown_on_exit)
         self._meters: Dict[str, Meter] = {}
         self._exporter_intervals = dict()
+        # guards creating meters and adding exporters so that each (meter, exporter) pipeline is only started once
+        self._meters_lock = threading.Lock()
 
     def add_exporter(self, exporter: MetricsExporter, interval: int):
-        if exporter not in self._exporters:
-            self._exporter_intervals[exporter] = interval
-            self._exporters.add(exporter)
-            for key, meter in self._meters.items():
-                self.start_pipeline(meter, exporter, interval)
+        with self._meters_lock:
+            if exporter not in self._exporters:
+                self._exporter_intervals[exporter] = interval
+                self._exporters.add(exporter)
+                for key, meter in self._meters.items():
+                    self.start_pipeline(meter, exporter, interval)
 
     def get_meter(self, instrumenting_module_name: str, instrumenting_library_version: str = "") -> Meter:
-
+        # lock-free once the meter exists
         meter = self._meters.get(instrumenting_module_name)
         if meter is None:
-            meter = super().get_meter(instrumenting_module_name, instrumenting_library_version)
-            self._meters[instrumenting_module_name] = meter
-
-            for exporter in self._exporters:
-                interval = self._exporter_intervals[exporter]
-                self.start_pipeline(meter, exporter, interval)
-
-        return meter
-
+            with self._meters_lock:
+                meter = self._meters.get(instrumenting_module_name)
+                if meter is None:
+                    meter = super().get_meter(instrumenting_module_name, instrumenting_library_version)
 
+                    for exporter in self._exporters:
+                        interval = self._exporter_intervals[exporter]
+                        self.start_pipeline(meter, exporter, interval)
 
+                    # published last, so that other threads only see the meter once its pipelines are started
+                    self._meters[instrumenting_module_name] = meter
 
+        return meter
@@ -1,8 +1,7 @@
-import abc
 import logging
 import os
+import sys
 import typing
-from contextlib import contextmanager
 from decimal import Decimal
 from enum import Enum
 from typing import Dict, Optional
@@ -10,8 +9,9 @@ from typing import Dict, Optional
 from opentelemetry import metrics as metrics_api, trace as trace_api
 from opentelemetry.sdk.metrics import MetricsExporter
 from opentelemetry.sdk.trace import TracerProvider, SynchronousMultiSpanProcessor, SpanProcessor
-from opentelemetry.sdk.trace.export import SimpleExportSpanProcessor, SpanExporter
+from opentelemetry.sdk.trace.export import BatchExportSpanProcessor, SimpleExportSpanProcessor, SpanExporter
 
+import telemetry
 from telemetry.api import Attribute, Label
 from telemetry.api.listeners.span_metrics import SpanMetricsProcessor
 from telemetry.api.metrics import Metrics, Observer
@@ -25,7 +25,11 @@ def _repo_url():
     return 'https://github.com/alchemy-way/telemetry-python'
 
 
-class Telemetry(abc.ABC):
+# `Telemetry` methods that forward unchanged to the same-named `Metrics` methods
+_METRICS_METHODS = ('counter', 'up_down_counter', 'record_value', 'gauge')
+
+
+class Telemetry:
     _instance: 'Telemetry' = None
 
     def __init__(self, span_processor=None, stateful: bool = True):
@@ -39,6 +43,13 @@ class Telemetry(abc.ABC):
         self.metrics = Metrics(self, stateful=stateful)
         self.span_processor.add_span_processor(SpanMetricsProcessor(self.metrics))
 
+        # the metric methods below only forward to `self.metrics` (which never changes for this instance), so bind
+        # them directly to skip a call frame per metric.  Methods overridden by a subclass are left alone.
+        cls = type(self)
+        for method_name in _METRICS_METHODS:
+            if getattr(cls, method_name) is getattr(Telemetry, method_name):
+                setattr(self, method_name, getattr(self.metrics, method_name))
+
     def register(self):
         """
         NOTE: Applications should instead call `initialize()`, which will call this method on the application's behalf.
@@ -66,7 +77,7 @@ class Telemetry(abc.ABC):
         """
         from telemetry.api.helpers.environment import Environment
 
-        logging.info(f"Initializing Telemetry API [exporters: ${os.environ.get('METRICS_EXPORTERS')}]")
+        logging.info("Initializing Telemetry API [exporters: %s]", os.environ.get('METRICS_EXPORTERS'))
 
         # mainly needed for testing where after we mock the environment, we need to refresh this class
         Environment.initialize()
@@ -101,7 +112,7 @@ class Telemetry(abc.ABC):
         :param interval: interval that metrics should be aggregated into.
         :return: None
         """
-        logging.info(f"Added metrics exporter: {metrics_exporter}")
+        logging.info("Added metrics exporter: %s", metrics_exporter)
         self.metrics.add_exporter(metrics_exporter, interval)
 
     def add_span_processor(self, span_processor: SpanProcessor, *instrumentors: str):
@@ -118,14 +129,22 @@ class Telemetry(abc.ABC):
         else:
             self.span_processor.add_span_processor(span_processor)
 
-    def add_span_exporter(self, span_exporter: SpanExporter):
+    def add_span_exporter(self, span_exporter: SpanExporter, batched: bool = True):
         """
         Adds a span exporter that will be called to export completed spans.
         :param span_exporter: the span exporter
+        :param batched: if True (the default), completed spans are queued in a bounded buffer and exported in batches
+                        from a background thread, so ending a span never blocks on the exporter.  Batching can be tuned
+                        via the `OTEL_BSP_*` environment variables (eg: `OTEL_BSP_MAX_QUEUE_SIZE`,
+                        `OTEL_BSP_SCHEDULE_DELAY_MILLIS`, `OTEL_BSP_MAX_EXPORT_BATCH_SIZE`).  If False, each span is
+                        exported synchronously when it ends.
         :return: None
         """
-        logging.info(f"Added trace exporter: {span_exporter}")
-        self.span_processor.add_span_processor(SimpleExportSpanProcessor(span_exporter))
+        logging.info("Added trace exporter: %s", span_exporter)
+        if batched:
+            self.span_processor.add_span_processor(BatchExportSpanProcessor(span_exporter))
+        else:
+            self.span_processor.add_span_processor(SimpleExportSpanProcessor(span_exporter))
 
     def span(self, category: str, name: str,
              attributes: Optional[typing.Mapping[typing.Union[Attribute, str], AttributeValue]] = None,
@@ -157,7 +176,7 @@ class Telemetry(abc.ABC):
         """
         return self.tracer.current_span
 
-    def counter(self, category: str, name: str, value: typing.Union[int, float] = 1, labels: Dict[typing.Union[Label, str], str] = {},
+    def counter(self, category: str, name: str, value: typing.Union[int, float] = 1, labels: Optional[Dict[typing.Union[Label, str], str]] = None,
                 unit: str = "1",
                 description: Optional[str] = None):
         """
@@ -173,7 +192,7 @@ class Telemetry(abc.ABC):
         """
         self.metrics.counter(category, name, value=value, labels=labels, unit=unit, description=description)
 
-    def up_down_counter(self, category: str, name: str, value: typing.Union[int, float] = 1, labels: Dict[typing.Union[Label, str], str] = {},
+    def up_down_counter(self, category: str, name: str, value: typing.Union[int, float] = 1, labels: Optional[Dict[typing.Union[Label, str], str]] = None,
                         unit: str = "1",
                         description: Optional[str] = None):
         """
@@ -189,7 +208,7 @@ class Telemetry(abc.ABC):
         """
         self.metrics.up_down_counter(category, name, value=value, labels=labels, unit=unit, description=description)
 
-    def record_value(self, category: str, name: str, value: typing.Union[int, float] = 1, labels: Dict[typing.Union[Label, str], str] = {},
+    def record_value(self, category: str, name: str, value: typing.Union[int, float] = 1, labels: Optional[Dict[typing.Union[Label, str], str]] = None,
                      unit: str = "1",
                      description: Optional[str] = None):
         """
@@ -230,6 +249,7 @@ class Telemetry(abc.ABC):
 
 
 class TelemetryApi:
+    __slots__ = ('category',)
 
     def __init__(self, category: str):
         self.category = category
@@ -253,16 +273,9 @@ class TelemetryApi:
         :return:
         """
 
-        from telemetry import tracer
-
-        @contextmanager
-        def wrapper():
-            with tracer.span(self.category, name, attributes=attributes, kind=kind) as span:
-                yield span
+        return telemetry._telemetry.tracer.span(self.category, name, attributes=attributes, kind=kind)
 
-        return wrapper()
-
-    def counter(self, name: str, value: int = 1, labels: Dict[typing.Union[Label, str], str] = {}, unit: str = "1", description: Optional[str] = None):
+    def counter(self, name: str, value: int = 1, labels: Optional[Dict[typing.Union[Label, str], str]] = None, unit: str = "1", description: Optional[str] = None):
         """
         Increments a counter value
 
@@ -273,10 +286,9 @@ class TelemetryApi:
         :param description: human-readable description for this metric
         :return: None
         """
-        from telemetry import metrics
-        metrics.counter(self.category, name, value=value, labels=labels, unit=unit, description=description)
+        telemetry._telemetry.metrics.counter(self.category, name, value=value, labels=labels, unit=unit, description=description)
 
-    def up_down_counter(self, name: str, value: int = 1, labels: Dict[typing.Union[Label, str], str] = {}, unit: str = "1",
+    def up_down_counter(self, name: str, value: int = 1, labels: Optional[Dict[typing.Union[Label, str], str]] = None, unit: str = "1",
                         description: Optional[str] = None):
         """
         Increments/decrements a counter value
@@ -288,10 +300,9 @@ class TelemetryApi:
         :param description: human-readable description for this metric
         :return: None
         """
-        from telemetry import metrics
-        metrics.up_down_counter(self.category, name, value=value, labels=labels, unit=unit, description=description)
+        telemetry._telemetry.metrics.up_down_counter(self.category, name, value=value, labels=labels, unit=unit, description=description)
 
-    def record_value(self, name: str, value: int = 1, labels: Dict[typing.Union[Label, str], str] = {}, unit: str = "1", description: Optional[str] = None):
+    def record_value(self, name: str, value: int = 1, labels: Optional[Dict[typing.Union[Label, str], str]] = None, unit: str = "1", description: Optional[str] = None):
         """
         Records a numeric value.  When exported, two metrics will be written:
         - <metric fqdn>_count: how many values were recorded in the metric interval
@@ -304,8 +315,7 @@ class TelemetryApi:
         :param description: human-readable description for this metric
         :return: None
         """
-        from telemetry import metrics
-        metrics.record_value(self.category, name, value=value, labels=labels, unit=unit, description=description)
+        telemetry._telemetry.metrics.record_value(self.category, name, value=value, labels=labels, unit=unit, description=description)
 
     def gauge(self, name: str, callback: typing.Callable[[Observer], None], unit: str = "1", description: Optional[str] = None):
         """
@@ -323,8 +333,7 @@ class TelemetryApi:
         :param description: human-readable description for this metric
         :return: None
         """
-        from telemetry import metrics
-        metrics.gauge(self.category, name, callback, unit=unit, description=description)
+        telemetry._telemetry.metrics.gauge(self.category, name, callback, unit=unit, description=description)
 
 
 class TelemetryMixin(object):
@@ -339,9 +348,22 @@ class TelemetryMixin(object):
     telemetry_category: Optional[str] = None
 
     def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
         if cls.telemetry_category is None:
-            cls.telemetry_category = f"{cls.__module__}.{cls.__name__}"
+            cls.telemetry_category = sys.intern(f"{cls.__module__}.{cls.__name__}")
 
     @property
     def telemetry(self) -> TelemetryApi:
-        return TelemetryApi(self.telemetry_category)
+        # `TelemetryApi` only holds the category, so a single (cached) instance is shared per category rather than
+        # creating one on each access
+        return _telemetry_api(self.telemetry_category)
+
+
+_TELEMETRY_API_CACHE: Dict[str, TelemetryApi] = {}
+
+
+def _telemetry_api(category: str) -> TelemetryApi:
+    api = _TELEMETRY_API_CACHE.get(category)
+    if api is None:
+        api = _TELEMETRY_API_CACHE.setdefault(category, TelemetryApi(category))
+    return api
@@ -1,15 +1,16 @@
 import enum
 import logging
+import os
 import re
-from contextlib import contextmanager
+import string
 from threading import RLock
-from typing import Dict, Optional, Union, Sequence, Mapping, ContextManager
+from typing import Dict, Optional, Union, Sequence, Mapping, ContextManager, AbstractSet
 
 import opentelemetry.sdk.trace as trace_sdk
 import opentelemetry.trace as trace_api
 from opentelemetry.trace import SpanKind as OTSpanKind
 
-from telemetry.api import Attribute, _REGISTRY, Attributes, Label
+from telemetry.api import Attribute, Attributes, Label, is_label
 
 AttributeValue = Union[
     str,
@@ -22,7 +23,15 @@ AttributeValue = Union[
     Sequence[Union[None, float]],
 ]
 
+# global tracing switches, read once at import.  When tracing is disabled (for all or some categories), `@trace`
+# decorated functions are called directly without creating a span.
+_TRACING_ENABLED = os.environ.get('METRICS_TRACING_ENABLED', 'true').lower() not in ('false', '0', 'no')
+_TRACING_DISABLED_CATEGORIES = frozenset(c.strip() for c in os.environ.get('METRICS_TRACING_DISABLED_CATEGORIES', '').split(',') if c.strip())
+
+
 class SpanContext:
+    __slots__ = ('trace_id', 'span_id', 'trace_state')
+
     def __init__(self, trace_id: str, span_id: str, trace_state: Dict[str, str]):
         self.trace_id = trace_id
         self.span_id = span_id
@@ -67,7 +76,13 @@ class SpanKind(enum.Enum):
 
 
 class Span:
+    # a thin wrapper that's created for each span start/end (and on each access), so keep it cheap to allocate
+    __slots__ = ('_span',)
+
     _ATTRIBUTE_NAME_PATTERN = re.compile('_*[a-zA-Z0-9_.\\-]+')
+    # translation table that deletes every character allowed by `_ATTRIBUTE_NAME_PATTERN`, so a (non-empty) name is
+    # valid exactly when nothing is left after translating it.  This is cheaper than running the regex.
+    _ATTRIBUTE_NAME_CHARS = str.maketrans('', '', string.ascii_letters + string.digits + '_.-')
 
     # used to track valid attribute keys so that we can skip validation after it's first seen
     _attribute_key_cache = set()
@@ -144,21 +159,25 @@ class Span:
             raise Exception(f"Expected a string for attribute name but got {name}!")
 
         if name not in self._attribute_key_cache:
-            if not isinstance(name, str):
-                logging.warning(f"attribute/label name must be a string! (name={name})")
-            elif not self._ATTRIBUTE_NAME_PATTERN.fullmatch(name):
-                logging.warning(f"attribute/label name must match the pattern: {self._ATTRIBUTE_NAME_PATTERN.pattern} (name={name})")
-            else:
-                if len(self._attribute_key_cache) > 1000:
-                    logging.warning("Over 1000 attribute names have been cached. This should be investigated and the"
-                                    "size warning should be increased if this is a valid use-case!")
-                self._attribute_key_cache.add(name)
+            self._validate_attribute_name(name)
 
         if value is not None:
             self._span.set_attribute(name, value)
             
         return self
 
+    @classmethod
+    def _validate_attribute_name(cls, name: str):
+        if not isinstance(name, str):
+            logging.warning(f"attribute/label name must be a string! (name={name})")
+        elif not name or name.translate(cls._ATTRIBUTE_NAME_CHARS):
+            logging.warning(f"attribute/label name must match the pattern: {cls._ATTRIBUTE_NAME_PATTERN.pattern} (name={name})")
+        else:
+            if len(cls._attribute_key_cache) > 1000:
+                logging.warning("Over 1000 attribute names have been cached. This should be investigated and the"
+                                "size warning should be increased if this is a valid use-case!")
+            cls._attribute_key_cache.add(name)
+
     def set_label(self, name: str, value: str) -> 'Span':
         if name is None:
             logging.warning(f"Called set_label with name == None!")
@@ -175,10 +194,10 @@ class Span:
             logging.warning(f"label value for must be a string! (name={name}, value={value})")
         else:
             self.set_attribute(name, value)
-            # mark this attribute as a label
-            label_keys = set(self._span.attributes.get(Attributes._LABEL_KEYS.name, ()))
-            label_keys.add(name)
-            self._span.set_attribute(Attributes._LABEL_KEYS.name, list(label_keys))
+            # mark this attribute as a label (the keys are only rewritten when the label is new to this span)
+            label_keys = self._span.attributes.get(Attributes._LABEL_KEYS.name, ())
+            if name not in label_keys:
+                self._span.set_attribute(Attributes._LABEL_KEYS.name, [*label_keys, name])
 
         return self
 
@@ -198,18 +217,57 @@ class Span:
 
     @property
     def labels(self) -> Dict[str, str]:
-        label_keys = set(self._span.attributes.get(Attributes._LABEL_KEYS.name, list()))
-        return {key: value for key, value in self.attributes.items() if key in label_keys or _REGISTRY.is_label(key)}
+        """
+        Return the (public) attributes that are labels, as a new dict
+        """
+        # single pass over the span's attributes, rather than filtering a copy made by `attributes`
+        attributes = self._span.attributes
+        label_keys = frozenset(attributes.get(Attributes._LABEL_KEYS.name, ()))
+        return {key: value for key, value in attributes.items()
+                if (key in label_keys or is_label(key)) and not key.startswith('_')}
 
     def events(self):
         return self._span.events
 
 
 class Tracer:
-    def __init__(self, tracer_provider: trace_sdk.TracerProvider, name: str = "default"):
+    __slots__ = ('name', 'enabled', 'disabled_categories', '_lock', '_tracer_provider', '_tracers')
+
+    def __init__(self, tracer_provider: trace_sdk.TracerProvider, name: str = "default",
+                 enabled: bool = _TRACING_ENABLED,
+                 disabled_categories: AbstractSet[str] = _TRACING_DISABLED_CATEGORIES):
         self.name = name
+        self.enabled = enabled
+        self.disabled_categories = frozenset(disabled_categories)
         self._lock = RLock()
         self._tracer_provider = tracer_provider
+        # otel tracers by category, since `trace_api.get_tracer` creates a new one on each call
+        self._tracers = {}
+
+    def is_enabled(self, category: str) -> bool:
+        """
+        Returns whether spans should be created for the given category
+        :param category: the span category
+        :return: True if tracing is enabled for the category
+        """
+        return self.enabled and category not in self.disabled_categories
+
+    def set_enabled(self, enabled: bool, *categories: str):
+        """
+        Enables/disables tracing at runtime, either for all categories or only for the given ones.  When disabled,
+        `@trace` decorated functions are called directly without creating a span.
+        :param enabled: whether tracing should be enabled
+        :param categories: categories to enable/disable.  If not specified, applies to all categories.
+        :return: None
+        """
+        with self._lock:
+            if not categories:
+                self.enabled = enabled
+            elif enabled:
+                # the set is replaced rather than mutated so that `is_enabled` never needs the lock
+                self.disabled_categories = self.disabled_categories.difference(categories)
+            else:
+                self.disabled_categories = self.disabled_categories.union(categories)
 
     def set(self, attribute_or_label: Attribute, value: AttributeValue) -> 'Tracer':
         if self.has_active_span:
@@ -243,11 +301,12 @@ class Tracer:
 
     @property
     def labels(self) -> Dict[str, str]:
-        output = {}
-        if not self.has_active_span:
-            return output
+        # returns a new dict on each call, so callers may update it
+        span = trace_api.get_current_span()
+        if span == trace_api.INVALID_SPAN:
+            return {}
 
-        return self.current_span.labels
+        return Span(span).labels
 
     @property
     def current_span(self) -> Optional[Span]:
@@ -256,44 +315,77 @@ class Tracer:
 
         return Span(trace_api.get_current_span())
 
+    def _get_tracer(self, category: str) -> trace_api.Tracer:
+        tracer = self._tracers.get(category)
+        if tracer is None:
+            # a race here at worst creates an extra (equivalent) tracer, so no lock is needed
+            tracer = self._tracers.setdefault(category, trace_api.get_tracer(category, tracer_provider=self._tracer_provider))
+        return tracer
+
     def span(self, category: str,
              name: str,
              attributes: Optional[Mapping[Attribute, AttributeValue]] = None,
              kind: SpanKind = SpanKind.INTERNAL) -> ContextManager[Span]:
+        return _SpanContextManager(self, category, name, attributes, kind)
 
-        from opentelemetry import trace
-
-        @contextmanager
-        def wrapper():
-            nonlocal name, attributes, kind
-
-            if not attributes:
-                attributes = {}
+    def shutdown(self):
+        self._tracer_provider.shutdown()
 
-            tracer = trace.get_tracer(category, tracer_provider=self._tracer_provider)
 
-            try:
-                attributes_copy = {}
-                attributes_copy[Attributes.TRACE_CATEGORY.name] = category
-                for key, value in attributes.items():
-                    if isinstance(key, str):
-                        attributes_copy[key] = value
-                    else:
-                        attributes_copy[key.name] = value
+class _SpanContextManager:
+    # returned by `Tracer.span`, which is on the hot path of all instrumented code.  A plain class is cheaper than a
+    # `@contextmanager` generator (no generator frame, closure or StopIteration handling per span).
+    __slots__ = ('_tracer', '_category', '_name', '_attributes', '_kind', '_span_cm')
+
+    def __init__(self, tracer: Tracer, category: str, name: str,
+                 attributes: Optional[Mapping[Attribute, AttributeValue]], kind: SpanKind):
+        self._tracer = tracer
+        self._category = category
+        self._name = name
+        self._attributes = attributes or {}
+        self._kind = kind
+        self._span_cm = None
+
+    def __enter__(self) -> Span:
+        category = self._category
+        attributes = self._attributes
+        tracer = self._tracer._get_tracer(category)
+
+        # the passed attributes (and which of them are labels) are all set when the span is started, rather than
+        # being written a second time through the `Span` wrapper
+        attributes_copy = {}
+        attributes_copy[Attributes.TRACE_CATEGORY.name] = category
+        label_keys = []
+        for key, value in attributes.items():
+            if isinstance(key, Attribute):
+                name = key.name
+                if key.is_label:
+                    value = str(value)
+                    label_keys.append(name)
+            else:
+                name = key
 
-                with tracer.start_as_current_span(name=name, attributes=attributes_copy, kind=SpanKind.to_otel_span_kind(kind)) as span:
-                    wrapped_span = Span(span)
+            if name not in Span._attribute_key_cache:
+                Span._validate_attribute_name(name)
+            attributes_copy[name] = value
 
-                    # set passed attributes
-                    for a, value in attributes.items():
-                        wrapped_span.set(a, value)
+        label_keys_name = Attributes._LABEL_KEYS.name
+        if label_keys:
+            attributes_copy[label_keys_name] = label_keys
 
-                    yield wrapped_span
+        span_cm = tracer.start_as_current_span(name=self._name, attributes=attributes_copy,
+                                               kind=SpanKind.to_otel_span_kind(self._kind))
+        self._span_cm = span_cm
+        span = span_cm.__enter__()
 
-            finally:
-                pass
+        # passed attributes take precedence over any (propagated/environment) values set by span processors on start,
+        # so restore the few that were overwritten.  Label keys are only ever added to by processors.
+        span_attributes = span.attributes
+        for name, value in attributes_copy.items():
+            if name != label_keys_name and span_attributes.get(name) != value:
+                span.set_attribute(name, value)
 
-        return wrapper()
+        return Span(span)
 
-    def shutdown(self):
-        self._tracer_provider.shutdown()
+    def __exit__(self, exc_type, exc_value, traceback) -> Optional[bool]:
+        return self._span_cm.__exit__(exc_type, exc_value, traceback)
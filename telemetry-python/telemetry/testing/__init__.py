@@ -48,7 +48,8 @@ class TelemetryFixture(Telemetry):
         super().__init__(span_processor=None, stateful=stateful)
         self.span_exporter = InMemorySpanExporter()
         self.metrics_exporter = InMemoryMetricsExporter()
-        self.add_span_exporter(span_exporter=self.span_exporter)
+        # exported synchronously so that tests can inspect spans as soon as they end
+        self.add_span_exporter(span_exporter=self.span_exporter, batched=False)
         self.add_metrics_exporter(metrics_exporter=self.metrics_exporter, interval=10000)
         self.collected = False
         self.caplog = JsonLogCaptureFormatter()
@@ -1,7 +1,7 @@
 import logging
 import time
 
-from telemetry import TelemetryMixin, trace
+from telemetry import TelemetryMixin, trace, telemetry
 from tests.attributes import TestAttributes
 
 
@@ -11,6 +11,13 @@ def global_method():
     time.sleep(0.1)  # artificial delay so that we can assert a non-zero elapsed time
 
 
+def module_import_method():
+    # uses the `telemetry` imported at module load, which must follow instances swapped in by `set_telemetry`
+    telemetry.counter('example', 'module_import_counter')
+    with telemetry.span('example', 'module_import_span'):
+        pass
+
+
 class ExampleClass(TelemetryMixin):
     def method1(self):
         self.telemetry.counter('method1_counter')
@@ -0,0 +1,32 @@
+from telemetry import Attributes
+from tests.attributes import TestAttributes
+
+
+class TestAttributeRegistry:
+    def test_registry_iteration(self):
+        registered = list(Attributes.registry())
+
+        assert Attributes.ENV in registered
+        assert TestAttributes.ATTRIB1 in registered
+
+    def test_registry_flags(self):
+        registry = Attributes.registry()
+
+        assert registry.is_label(TestAttributes.LABEL1.name)
+        assert not registry.is_label(TestAttributes.ATTRIB1.name)
+        assert registry.propagate(Attributes.GRPC_METHOD.name)
+        assert not registry.propagate(Attributes.TRACE_STATUS.name)
+        assert not registry.is_label('not_registered')
+        assert TestAttributes.LABEL1.name in registry.label_keys
+
+    def test_registry_propagated_keys(self):
+        from telemetry import Attribute
+
+        registry = Attributes.registry()
+
+        assert Attributes.GRPC_METHOD.name in registry.propagated_keys
+        assert Attributes.TRACE_STATUS.name not in registry.propagated_keys
+
+        # registering a new attribute invalidates the cached set
+        attribute = Attribute('test.propagated_keys')
+        assert attribute.name in registry.propagated_keys
@@ -1,6 +1,7 @@
 import logging
 import time
 from dataclasses import dataclass, field
+from enum import Enum
 from typing import Optional
 
 import pytest
@@ -17,6 +18,29 @@ class ComplexValue:
     age: Optional[int] = field(default=None)
 
 
+class Color(Enum):
+    RED = 1
+    BLUE = 2
+
+
+class Mode(str, Enum):
+    FAST = 'fast'
+    SLOW = 'slow'
+
+
+ARG_NAMES = Label('arg_names')
+
+
+def _extract_arg_names(arguments, fn):
+    return {ARG_NAMES: ','.join(sorted(arguments))}
+
+
+@trace
+def function_with_cls_parameter(cls, arg1: str):
+    # a module function, even though the first parameter is named `cls`
+    logging.info(f'function_with_cls_parameter log')
+
+
 class DecoratorExample(TelemetryMixin):
     @trace
     def method_trace_default(self, arg1: str, arg2: int = 10):
@@ -46,6 +70,42 @@ class DecoratorExample(TelemetryMixin):
     def method_complex_argument_label(self, arg1: ComplexValue):
         logging.info(f'method_complex_argument_label log')
 
+    @trace(extractor=extract_args(arg1=Label, arg2=Label))
+    def method_enum_argument_label(self, arg1: Color, arg2):
+        logging.info(f'method_enum_argument_label log')
+
+    @trace(extractor=extract_args(arg1=Label))
+    def method_str_enum_argument_label(self, arg1: str):
+        logging.info(f'method_str_enum_argument_label log')
+
+    @classmethod
+    @trace
+    def method_classmethod(cls, arg1: str):
+        logging.info(f'method_classmethod log')
+
+    @classmethod
+    @trace(extractor=_extract_arg_names)
+    def method_classmethod_arg_names(cls, arg1: str):
+        logging.info(f'method_classmethod_arg_names log')
+
+    @trace(extractor=_extract_arg_names)
+    def method_renamed_self_arg_names(this, arg1: str):
+        logging.info(f'method_renamed_self_arg_names log')
+
+    @staticmethod
+    @trace(extractor=_extract_arg_names)
+    def method_staticmethod_arg_names(arg1: str, arg2: str):
+        logging.info(f'method_staticmethod_arg_names log')
+
+    @trace
+    def method_renamed_self(this):
+        logging.info(f'method_renamed_self log')
+
+    @staticmethod
+    @trace
+    def method_staticmethod(arg1: str):
+        logging.info(f'method_staticmethod log')
+
     # @trace(labels={'label1': 't1'}, attributes={'attribute1': 'a1'})
     # def method_outer(self, arg1: str, arg2: int = 10):
     #     logging.info(f'method_outer log')
@@ -57,6 +117,15 @@ class DecoratorExample(TelemetryMixin):
     #     logging.info(f'method_inner log')
 
 
+class InstanceCategoryExample(TelemetryMixin):
+    def __init__(self, category: str):
+        self.telemetry_category = category
+
+    @trace
+    def run(self):
+        self.telemetry.counter('run_counter')
+
+
 class TestDecorator:
 
     def test_decorator_global_method(self, telemetry: TelemetryFixture, caplog):
@@ -164,14 +233,24 @@ class TestDecorator:
     def test_decorator_invalid_argument_label(self, telemetry: TelemetryFixture, caplog):
         telemetry.enable_log_record_capture(caplog)
 
+        # the missing argument is reported once, when the decorator is applied
+        class InvalidArgumentExample:
+            @trace(extractor=extract_args("arg4", arg2=Label))  # arg4 is invalid
+            def method_invalid_argument_label(self, arg1: str, arg2: str = 'arg2_value'):
+                pass
+
+        telemetry.caplog.assert_log_contains(
+            "@trace decorator refers to an argument 'arg4' that was not found in the signature for "
+            "TestDecorator.test_decorator_invalid_argument_label.<locals>.InvalidArgumentExample.method_invalid_argument_label",
+            'WARNING')
+        caplog.clear()
+
         example = DecoratorExample()
         example.method_invalid_argument_label(arg1='arg1_value')
 
         telemetry.collect()
 
-        telemetry.caplog.assert_log_contains(
-            "@trace decorator refers to an argument 'arg4' that was not found in the signature for DecoratorExample.method_invalid_argument_label",
-            'WARNING')
+        assert not [r for r in caplog.records if "'arg4'" in r.getMessage()]
 
     def test_decorator_ignore_complex_argument_label(self, telemetry: TelemetryFixture, caplog):
         telemetry.enable_log_record_capture(caplog)
@@ -186,6 +265,90 @@ class TestDecorator:
                                                     Attributes.TRACE_CATEGORY.name: 'tests.test_decorator.DecoratorExample',
                                                     Attributes.TRACE_NAME.name: 'tests.test_decorator.DecoratorExample.method_complex_argument_label'}).count == 1
 
+    def test_decorator_enum_argument_label(self, telemetry: TelemetryFixture):
+        example = DecoratorExample()
+        example.method_enum_argument_label(Color.RED, Color.BLUE)
+
+        telemetry.collect()
+
+        assert telemetry.get_value_recorder(name='trace.duration',
+                                            labels={'arg1': 'RED', 'arg2': 'BLUE',
+                                                    Attributes.TRACE_STATUS.name: 'OK',
+                                                    Attributes.TRACE_CATEGORY.name: 'tests.test_decorator.DecoratorExample',
+                                                    Attributes.TRACE_NAME.name: 'tests.test_decorator.DecoratorExample.method_enum_argument_label'}).count == 1
+
+    def test_decorator_str_enum_argument_label(self, telemetry: TelemetryFixture):
+        # annotations don't guarantee the runtime type, so enum values are converted even for a `str` parameter
+        example = DecoratorExample()
+        example.method_str_enum_argument_label(Mode.FAST)
+
+        telemetry.collect()
+
+        assert telemetry.get_value_recorder(name='trace.duration',
+                                            labels={'arg1': 'FAST',
+                                                    Attributes.TRACE_STATUS.name: 'OK',
+                                                    Attributes.TRACE_CATEGORY.name: 'tests.test_decorator.DecoratorExample',
+                                                    Attributes.TRACE_NAME.name: 'tests.test_decorator.DecoratorExample.method_str_enum_argument_label'}).count == 1
+
+    def test_decorator_classmethod(self, telemetry: TelemetryFixture):
+        DecoratorExample.method_classmethod('arg1_value')
+
+        telemetry.collect()
+
+        assert telemetry.get_value_recorder('trace.duration', labels={
+            Attributes.TRACE_CATEGORY.name: 'tests.test_decorator.DecoratorExample',
+            Attributes.TRACE_NAME.name: 'tests.test_decorator.DecoratorExample.method_classmethod',
+            Attributes.TRACE_STATUS.name: 'OK'}).count == 1
+
+    def test_decorator_method_category(self, telemetry: TelemetryFixture):
+        # methods are detected from where they're defined, not from the name of the first parameter
+        function_with_cls_parameter(int, 'arg1_value')
+        DecoratorExample().method_renamed_self()
+        DecoratorExample.method_staticmethod('arg1_value')
+
+        telemetry.collect()
+
+        assert telemetry.get_value_recorder('trace.duration', labels={
+            Attributes.TRACE_CATEGORY.name: 'tests.test_decorator',
+            Attributes.TRACE_NAME.name: 'tests.test_decorator.function_with_cls_parameter',
+            Attributes.TRACE_STATUS.name: 'OK'}).count == 1
+        assert telemetry.get_value_recorder('trace.duration', labels={
+            Attributes.TRACE_CATEGORY.name: 'tests.test_decorator.DecoratorExample',
+            Attributes.TRACE_NAME.name: 'tests.test_decorator.DecoratorExample.method_renamed_self',
+            Attributes.TRACE_STATUS.name: 'OK'}).count == 1
+        assert telemetry.get_value_recorder('trace.duration', labels={
+            Attributes.TRACE_CATEGORY.name: 'tests.test_decorator',
+            Attributes.TRACE_NAME.name: 'tests.test_decorator.method_staticmethod',
+            Attributes.TRACE_STATUS.name: 'OK'}).count == 1
+
+    def test_decorator_instance_category(self, telemetry: TelemetryFixture):
+        # spans and metrics both use the category set on the instance
+        InstanceCategoryExample('custom.a').run()
+        InstanceCategoryExample('custom.b').run()
+
+        telemetry.collect()
+
+        for category in ('custom.a', 'custom.b'):
+            assert len(telemetry.get_finished_spans(name_filter=lambda name: name == f'{category}.run')) == 1
+            assert telemetry.get_counter(f'{category}.run_counter', labels={
+                Attributes.TRACE_CATEGORY.name: category,
+                Attributes.TRACE_NAME.name: f'{category}.run'}).value == 1
+
+    def test_decorator_receiver_not_extracted(self, telemetry: TelemetryFixture):
+        # the instance/class a method is called on is never passed to extractors, whatever the parameter is named
+        DecoratorExample.method_classmethod_arg_names('arg1_value')
+        DecoratorExample().method_renamed_self_arg_names('arg1_value')
+        DecoratorExample.method_staticmethod_arg_names('arg1_value', 'arg2_value')
+
+        telemetry.collect()
+
+        for method, arg_names in (('method_classmethod_arg_names', 'arg1'),
+                                  ('method_renamed_self_arg_names', 'arg1'),
+                                  ('method_staticmethod_arg_names', 'arg1,arg2')):
+            assert len(telemetry.get_finished_spans(
+                name_filter=lambda name: name.endswith(f'.{method}'),
+                attribute_filter=lambda a: a.get('arg_names') == arg_names)) == 1
+
     def test_decorator_local_def(self, telemetry: TelemetryFixture):
         @trace(extractor=extract_args("arg"))
         def foo(arg: str):
@@ -217,6 +380,39 @@ class TestDecorator:
             Attributes.TRACE_NAME.name: 'tests.test_decorator.foo',
             Attributes.TRACE_STATUS.name: 'OK', 'arg2_renamed': 'arg2', 'arg4': 'arg4'}).count == 1
 
+    def test_decorator_disabled_category(self, telemetry: TelemetryFixture):
+        @trace(category='disabled_category')
+        def foo(arg: str):
+            return arg
+
+        telemetry.tracer.disabled_categories = frozenset({'disabled_category'})
+
+        assert foo('value') == 'value'
+        assert len(telemetry.get_finished_spans()) == 0
+
+        telemetry.tracer.disabled_categories = frozenset()
+
+        assert foo('value') == 'value'
+        assert len(telemetry.get_finished_spans(name_filter=lambda name: name == 'disabled_category.foo')) == 1
+
+    def test_decorator_set_enabled(self, telemetry: TelemetryFixture):
+        @trace(category='toggled_category')
+        def foo(arg: str):
+            return arg
+
+        telemetry.tracer.set_enabled(False, 'toggled_category')
+        assert foo('value') == 'value'
+        assert len(telemetry.get_finished_spans()) == 0
+
+        telemetry.tracer.set_enabled(True, 'toggled_category')
+        telemetry.tracer.set_enabled(False)
+        assert foo('value') == 'value'
+        assert len(telemetry.get_finished_spans()) == 0
+
+        telemetry.tracer.set_enabled(True)
+        assert foo('value') == 'value'
+        assert len(telemetry.get_finished_spans(name_filter=lambda name: name == 'toggled_category.foo')) == 1
+
     def test_decorator_throws_exception_on_invalid_usage(self, telemetry: TelemetryFixture):
         """
         Exception should be raised in this case since the "foo" will not be passed as a decorator value but used as the
@@ -1,4 +1,5 @@
 import logging
+import os
 
 from telemetry import Attributes
 from telemetry.api.helpers.environment import Environment
@@ -93,3 +94,77 @@ class TestEnvironment:
                                                                    'label2': 'label2_value'}).value == 1
 
         Environment._clear()
+
+    def test_initialize_reparses_only_when_changed(self, monkeypatch):
+        # don't depend on any labels/attributes set in the ambient environment
+        for key in list(os.environ):
+            if key in Environment.label_variables or key.startswith((Environment.label_prefix, Environment.attrib_prefix)):
+                monkeypatch.delenv(key)
+
+        monkeypatch.setenv('METRICS_LABEL_label1', 'label1_value')
+        monkeypatch.setenv('METRICS_APP_NAME', 'app')
+
+        Environment.initialize()
+        labels = Environment.labels
+        assert labels == {'label1': 'label1_value', 'app.name': 'app'}
+        assert Environment.attributes == {'app.name': 'app'}
+
+        # unchanged environment keeps the parsed dicts
+        Environment.initialize()
+        assert Environment.labels is labels
+
+        # labels changed outside of `Environment` are restored from the (unchanged) environment
+        Environment.labels['label2'] = 'label2_value'
+        Environment.initialize()
+        assert Environment.labels == {'label1': 'label1_value', 'app.name': 'app'}
+
+        Environment.labels = {}
+        Environment.initialize()
+        assert Environment.labels == {'label1': 'label1_value', 'app.name': 'app'}
+
+        monkeypatch.setenv('METRICS_LABEL_label1', 'label1_changed')
+        Environment.initialize()
+        assert Environment.labels == {'label1': 'label1_changed', 'app.name': 'app'}
+
+        Environment._clear()
+
+    def test_environment_changed_in_place(self, monkeypatch, telemetry: TelemetryFixture):
+        monkeypatch.setenv('METRICS_LABEL_label1', 'label1_value')
+        telemetry.initialize()
+
+        with telemetry.span("category1", 'span1'):
+            pass
+
+        # changes made in place (rather than by re-initializing) are picked up by spans started afterwards
+        Environment.labels['label2'] = 'label2_value'
+        Environment.attributes['attrib2'] = 'attrib2_value'
+
+        with telemetry.span("category1", 'span2'):
+            pass
+
+        assert len(telemetry.get_finished_spans(name_filter=lambda name: name == 'category1.span1',
+                                                label_filter=lambda labels: 'label2' not in labels)) == 1
+        assert len(telemetry.get_finished_spans(name_filter=lambda name: name == 'category1.span2',
+                                                attribute_filter=lambda a: a.get('attrib2') == 'attrib2_value',
+                                                label_filter=lambda labels: labels.get('label1') == 'label1_value' and
+                                                                            labels.get('label2') == 'label2_value')) == 1
+
+        Environment._clear()
+
+    def test_environment_metric_labels_changed_in_place(self, monkeypatch, telemetry: TelemetryFixture):
+        monkeypatch.setenv('METRICS_LABEL_label1', 'label1_value')
+        telemetry.initialize()
+
+        telemetry.counter('category1', 'counter1', 1)
+        telemetry.collect()
+        assert telemetry.get_counter('category1.counter1', labels={'label1': 'label1_value'}).value == 1
+
+        # changes made in place (rather than by re-initializing) are applied on the next export
+        Environment.labels['label2'] = 'label2_value'
+
+        telemetry.counter('category1', 'counter2', 1)
+        telemetry.collect()
+        assert telemetry.get_counter('category1.counter2', labels={'label1': 'label1_value',
+                                                                   'label2': 'label2_value'}).value == 1
+
+        Environment._clear()
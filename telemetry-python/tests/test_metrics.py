@@ -71,3 +71,32 @@ class TestMetrics:
 
         assert len(telemetry.get_metrics()) == 2
         assert len(telemetry.get_metrics(instrumentor_filter=lambda name: name == "default")) == 2
+
+    def test_concurrent_get_meter(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from telemetry.api.otel.meter_provider import ManagedMeterProvider
+
+        provider = ManagedMeterProvider(shutdown_on_exit=False)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            meters = list(executor.map(lambda _: provider.get_meter('concurrent'), range(32)))
+
+        # every caller gets the same meter
+        assert len({id(meter) for meter in meters}) == 1
+
+    def test_subclass_metric_override(self, telemetry: TelemetryFixture):
+        class CountingTelemetry(TelemetryFixture):
+            def counter(self, category: str, name: str, value=1, labels=None, unit: str = "1", description=None):
+                self.counted.append(name)
+                super().counter(category, name, value=value, labels=labels, unit=unit, description=description)
+
+        counting = CountingTelemetry()
+        counting.counted = []
+        counting.counter("category1", "counter1")
+        counting.record_value("category1", "recorder1", 10)
+
+        counting.collect()
+
+        assert counting.counted == ['counter1']
+        assert counting.get_counter('category1.counter1').value == 1
+        assert counting.get_value_recorder('category1.recorder1').count == 1
@@ -74,3 +74,23 @@ class TestPrometheusExporter:
         telemetry.shutdown()
 
 
+
+    def test_export_groups_records_by_instrumentor(self):
+        from types import SimpleNamespace
+        from opentelemetry.sdk.util.instrumentation import InstrumentationInfo
+        from telemetry.api.exporter.prometheus import PrometheusMetricsExporter
+
+        def record(info: InstrumentationInfo):
+            return SimpleNamespace(instrument=SimpleNamespace(meter=SimpleNamespace(instrumentation_info=info)))
+
+        info1 = InstrumentationInfo('instrumentor1', '')
+        info2 = InstrumentationInfo('instrumentor2', '')
+
+        exporter = PrometheusMetricsExporter(start_server=False)
+        try:
+            exporter.export([record(info1), record(info2), record(info1)])
+
+            assert len(exporter.collectors[info1]._metrics_to_export) == 2
+            assert len(exporter.collectors[info2]._metrics_to_export) == 1
+        finally:
+            exporter.shutdown()
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 
 import responses
@@ -76,6 +77,8 @@ class TestTracer:
         telemetry.collect()
 
         assert example.telemetry_category == 'tests.example.ExampleClass'
+        # the api is shared for the category
+        assert example.telemetry is ExampleClass().telemetry
 
         # method1 (direct)
         assert telemetry.get_counter('tests.example.ExampleClass.method1_counter').value == 1
@@ -179,6 +182,8 @@ class TestTracer:
         method2_span = telemetry.get_finished_spans(name_filter=lambda name: name == 'tests.example.ExampleClass.method2')[0]
 
         log_record = telemetry.caplog.get_record(lambda l: l['message'] == 'method1 log')
+        # timestamp is the record's creation time in local ISO-8601 format
+        assert datetime.strptime(log_record['@timestamp'], '%Y-%m-%dT%H:%M:%S.%f')
         assert log_record['attributes'] == {TestAttributes.ATTRIB1.name: 'value1',
                                             TestAttributes.LABEL1.name: 'value1',
                                             Attributes.TRACE_ID.name: method1_span.context.trace_id,
@@ -212,6 +217,29 @@ class TestTracer:
                                                     Attributes.TRACE_NAME.name: 'tests.example.ExampleClass.method2'}).count == 1
         assert len(telemetry.get_value_recorders()) == 2
 
+    def test_mixin_telemetry_lookup(self, telemetry: TelemetryFixture):
+        from telemetry import TelemetryMixin
+
+        class OwnTelemetry(TelemetryMixin):
+            telemetry = 'own'
+
+        class InstanceCategory(TelemetryMixin):
+            def __init__(self, category: str):
+                self.telemetry_category = category
+
+        # a subclass's own `telemetry` attribute is kept
+        assert OwnTelemetry().telemetry == 'own'
+
+        # a category set on the instance is used
+        InstanceCategory('instance_category').telemetry.counter('counter1')
+
+        # the mixin can be used directly
+        assert TelemetryMixin().telemetry.category is None
+
+        telemetry.collect()
+
+        assert telemetry.get_counter('instance_category.counter1').value == 1
+
     def test_span_events(self, telemetry: TelemetryFixture):
         with telemetry.span('test', 'span1', attributes={TestAttributes.LABEL1: 'span1_value1'}) as span1:
             span1.set_attribute('label2', 'span1_value2')
@@ -224,6 +252,16 @@ class TestTracer:
                     assert len(span3.events()) == 1
                     assert len(span2.events()) == 1
 
+    def test_module_import(self, telemetry: TelemetryFixture):
+        # `from telemetry import telemetry` at module load must still report to the fixture's instance
+        from tests.example import module_import_method
+        module_import_method()
+
+        telemetry.collect()
+
+        assert len(telemetry.get_finished_spans(name_filter=lambda name: name == 'example.module_import_span')) == 1
+        assert telemetry.get_counter('example.module_import_counter').value == 1
+
     @responses.activate
     def test_third_party_instrumentor(self, telemetry: TelemetryFixture):
         import requests
@@ -254,6 +292,46 @@ class TestTracer:
                                                     Attributes.TRACE_NAME.name: 'requests.HTTP GET',
                                                     Attributes.TRACE_STATUS.name: 'ERROR'}).count == 1
 
+    def test_instrumentor_span_listener(self, telemetry: TelemetryFixture):
+        from opentelemetry.sdk.trace import SpanProcessor
+        from telemetry.api.listeners.span import InstrumentorSpanListener
+
+        class Recorder(SpanProcessor):
+            def __init__(self):
+                self.started = []
+                self.ended = []
+
+            def on_start(self, span: "Span", parent_context: Optional[context_api.Context] = None) -> None:
+                self.started.append(span.name)
+
+            def on_end(self, span: "Span") -> None:
+                self.ended.append(span.name)
+
+        recorder = Recorder()
+        telemetry.add_span_processor(InstrumentorSpanListener(recorder, 'category1'))
+
+        with telemetry.span("category1", "span1"):
+            pass
+        with telemetry.span("category2", "span2"):
+            pass
+
+        # only spans from the given instrumentor are passed to the delegate
+        assert recorder.started == ['span1']
+        assert recorder.ended == ['span1']
+
+    def test_batched_span_exporter(self, telemetry: TelemetryFixture):
+        from telemetry.api.exporter.memory import InMemorySpanExporter
+
+        exporter = InMemorySpanExporter()
+        telemetry.add_span_exporter(exporter, batched=True)
+
+        with telemetry.span("category1", "span1"):
+            pass
+
+        telemetry.span_processor.force_flush()
+
+        assert [span.name for span in exporter.get_finished_spans()] == ['span1']
+
     def test_span_listener(self, telemetry: TelemetryFixture):
         from opentelemetry.sdk.trace import SpanProcessor
         class Customlabelger(SpanProcessor):